@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import sys
 import os
+import re
+from bisect import bisect_right
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import NamedTuple
 from dotenv import load_dotenv
 import random
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
 load_dotenv()
 
 # StartGG API endpoints
@@ -21,6 +32,29 @@ if not AUTH_TOKEN:
     print("Or create a .env file with: STARTGG_TOKEN=your_token_here")
     sys.exit(1)
 
+# Shared HTTP session so consecutive GraphQL calls reuse the same
+# keep-alive connection instead of paying a TLS handshake each time
+SESSION = requests.Session()
+
+# Size the connection pool for concurrent phase fetches. Reads are retried
+# on transient failures (rate limits, 5xx); mutations are never retried so a
+# seed swap cannot be applied twice.
+SESSION.mount(
+    API_URL_READ,
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+SESSION.mount(API_URL_WRITE, HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 # State mappings
 PHASE_STATES = {
     "CREATED": 1,
@@ -35,6 +69,19 @@ PHASE_STATES = {
     3: 3,
 }
 
+# Trailing number of a phase name ("Swiss Round 3" -> 3)
+ROUND_NUMBER_PATTERN = re.compile(r"(?:^|\s)([+-]?\d+)\s*$")
+
+# Name fragments that mark a phase as one of the five Swiss rounds
+SWISS_ROUND_NAMES = tuple(f"round {i}" for i in range(1, 6))
+
+# Phase classifiers: a Swiss phase mentions "round" and a digit 1-5 (in
+# either order), a bracket phase mentions "bracket"
+SWISS_PHASE_PATTERN = re.compile(
+    r"round.*[1-5]|[1-5].*round", re.IGNORECASE | re.DOTALL
+)
+BRACKET_PHASE_PATTERN = re.compile(r"bracket", re.IGNORECASE)
+
 
 def get_phase_state(state):
     """Convert phase state to numeric value"""
@@ -43,6 +90,11 @@ def get_phase_state(state):
     return PHASE_STATES.get(state, 1)
 
 
+def is_complete_state(state):
+    """Check whether a phase or set state means completed"""
+    return PHASE_STATES.get(state, 1) == 3
+
+
 # Simplified query to get basic phase info first
 PHASES_QUERY = """
 query GetPhases($slug: String!) {
@@ -58,36 +110,23 @@ query GetPhases($slug: String!) {
 }
 """
 
-# Separate query for detailed phase data
+# Separate query for detailed phase data. Only fields that are read are
+# selected; seeds are only needed for initial seeding and round updates.
 PHASE_DETAILS_QUERY = """
-query GetPhaseDetails($phaseId: ID!) {
+query GetPhaseDetails($phaseId: ID!, $includeSeeds: Boolean!) {
   phase(id: $phaseId) {
     id
     name
     phaseGroups {
       nodes {
         id
-        displayIdentifier
-        seeds(query: {perPage: 100}) {
+        seeds(query: {perPage: 100}) @include(if: $includeSeeds) {
           nodes {
             id
             seedNum
             placement
             entrant {
               id
-              name
-              participants {
-                gamerTag
-              }
-            }
-          }
-        }
-        standings(query: {perPage: 100}) {
-          nodes {
-            placement
-            entrant {
-              id
-              name
               participants {
                 gamerTag
               }
@@ -99,15 +138,10 @@ query GetPhaseDetails($phaseId: ID!) {
             id
             round
             winnerId
-            completedAt
             state
             slots {
-              seed {
-                seedNum
-              }
               entrant {
                 id
-                name
                 participants {
                   gamerTag
                 }
@@ -136,7 +170,7 @@ def make_request(query, variables, is_mutation=False):
         headers["User-Agent"] = "Python/daness-script"
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             url,
             headers=headers,
             json={"query": query, "variables": variables},
@@ -148,7 +182,9 @@ def make_request(query, variables, is_mutation=False):
             print(f"Response: {response.text}")
             return None
 
-        return response.json()
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return json.loads(response.content)
 
     except requests.exceptions.Timeout:
         print("❌ Request timed out after 30 seconds")
@@ -161,6 +197,28 @@ def make_request(query, variables, is_mutation=False):
         return None
 
 
+def fetch_phase_details(phase_ids, seeds_phase_ids=(), max_workers=8):
+    """Fetch detailed data for several phases concurrently, keyed by phase ID
+
+    Seeds are only requested for the phases listed in seeds_phase_ids.
+    """
+    if not phase_ids:
+        return {}
+
+    def fetch(phase_id):
+        phase_data = make_request(
+            PHASE_DETAILS_QUERY,
+            {"phaseId": phase_id, "includeSeeds": phase_id in seeds_phase_ids},
+        )
+        if phase_data and "data" in phase_data and phase_data["data"]["phase"]:
+            return phase_data["data"]["phase"]
+        return None
+
+    # Requests are I/O-bound, so threads let the round-trips overlap
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(phase_ids))) as executor:
+        return dict(zip(phase_ids, executor.map(fetch, phase_ids)))
+
+
 def save_initial_seeding(event_slug, seeds):
     """Save initial seeding to file"""
     filename = f"{event_slug.replace('/', '-')}-seeding.txt"
@@ -169,83 +227,120 @@ def save_initial_seeding(event_slug, seeds):
         print(f"Initial seeding file {filename} already exists - using existing file")
         return filename
 
+    lines = [
+        f"{seed['seedNum']}: {seed['entrant']['participants'][0]['gamerTag']}\n"
+        for seed in sorted(seeds, key=lambda x: x["seedNum"])
+    ]
     with open(filename, "w") as f:
-        for seed in sorted(seeds, key=lambda x: x["seedNum"]):
-            gamer_tag = seed["entrant"]["participants"][0]["gamerTag"]
-            f.write(f"{seed['seedNum']}: {gamer_tag}\n")
+        f.write("".join(lines))
     print(f"Initial seeding saved to {filename}")
     return filename
 
 
 def load_initial_seeding(filename):
     """Load initial seeding from file"""
-    seeding = {}
     with open(filename, "r") as f:
-        for line in f:
-            seed_num, gamer_tag = line.strip().split(": ", 1)
-            seeding[gamer_tag] = int(seed_num)
-    return seeding
+        entries = (line.strip().split(": ", 1) for line in f)
+        return {gamer_tag: int(seed_num) for seed_num, gamer_tag in entries}
+
+
+def load_phase_cache(event_slug):
+    """Load cached details of completed phases, keyed by phase ID"""
+    filename = f"{event_slug.replace('/', '-')}-phases.json"
+
+    if not os.path.exists(filename):
+        return {}
+
+    try:
+        with open(filename, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        print(f"⚠️  Ignoring unreadable phase cache {filename}")
+        return {}
+
+
+def save_phase_cache(event_slug, phase_cache):
+    """Save details of completed phases to file, keyed by phase ID"""
+    filename = f"{event_slug.replace('/', '-')}-phases.json"
+
+    with open(filename, "w") as f:
+        json.dump(phase_cache, f)
+    return filename
 
 
 def get_match_results_from_phases(phases, swiss_only=False):
     """Extract all match results from completed phases"""
     all_results = []
+    append_result = all_results.append
 
     for phase in phases:
-        phase_state = get_phase_state(phase["state"])
-        phase_name_lower = phase["name"].lower()
+        # Only completed phases have results; skip everything else before
+        # looking at names or descending into sets
+        if get_phase_state(phase["state"]) != 3:
+            continue
+
+        phase_name = phase["name"]
+        round_num = extract_round_number(phase_name)
 
         # Skip non-Swiss phases if swiss_only is True
         if swiss_only:
+            phase_name_lower = phase_name.lower()
             if "bracket" in phase_name_lower or "final" in phase_name_lower:
                 continue
             # Only include Swiss rounds 1-5
-            if not any(f"round {i}" in phase_name_lower for i in range(1, 6)):
-                continue
-
-        if phase_state == 3:  # COMPLETED state
-            phase_name = phase["name"]
-            round_num = extract_round_number(phase_name)
-
-            # Additional check for Swiss only
-            if swiss_only and round_num > 5:
+            if round_num > 5 or not any(
+                name in phase_name_lower for name in SWISS_ROUND_NAMES
+            ):
                 continue
 
-            for group in phase["phaseGroups"]["nodes"]:
-                for set_data in group["sets"]["nodes"]:
-                    set_state = get_phase_state(set_data["state"])
-                    if set_state == 3 and set_data["winnerId"]:  # Completed
-                        winner_id = set_data["winnerId"]
-
-                        match_result = {
-                            "round": round_num,
-                            "winner_id": winner_id,
-                            "players": [],
-                            "phase_name": phase["name"],  # Add phase name for debugging
-                        }
+        for group in phase["phaseGroups"]["nodes"]:
+            for set_data in group["sets"]["nodes"]:
+                if (
+                    not is_complete_state(set_data["state"])
+                    or not set_data["winnerId"]
+                ):
+                    continue
 
-                        for slot in set_data["slots"]:
-                            if slot["entrant"]:
-                                match_result["players"].append(
-                                    {
-                                        "id": slot["entrant"]["id"],
-                                        "name": slot["entrant"]["participants"][0][
-                                            "gamerTag"
-                                        ],
-                                    }
-                                )
+                players = []
+                for slot in set_data["slots"]:
+                    entrant = slot["entrant"]
+                    if entrant:
+                        players.append(
+                            {
+                                "id": entrant["id"],
+                                "name": entrant["participants"][0]["gamerTag"],
+                            }
+                        )
 
-                        all_results.append(match_result)
+                append_result(
+                    {
+                        "round": round_num,
+                        "winner_id": set_data["winnerId"],
+                        "players": players,
+                        "phase_name": phase_name,  # Add phase name for debugging
+                    }
+                )
 
     return all_results
 
 
 def extract_round_number(phase_name):
     """Extract round number from phase name"""
-    try:
-        return int(phase_name.split()[-1])
-    except:
-        return 1
+    match = ROUND_NUMBER_PATTERN.search(phase_name)
+    return int(match.group(1)) if match else 1
+
+
+def get_phase_type(phase):
+    """Classify a phase as "swiss", "bracket" or None, caching it on the phase"""
+    if "phaseType" not in phase:
+        phase_name = phase["name"]
+        if SWISS_PHASE_PATTERN.search(phase_name):
+            phase["phaseType"] = "swiss"
+        elif BRACKET_PHASE_PATTERN.search(phase_name):
+            phase["phaseType"] = "bracket"
+        else:
+            phase["phaseType"] = None
+    return phase["phaseType"]
 
 
 def calculate_standings(initial_seeding, match_results):
@@ -266,15 +361,20 @@ def calculate_standings(initial_seeding, match_results):
     for match in match_results:
         winner_id = match["winner_id"]
 
-        for player in match["players"]:
+        # Sets have at most two entrants, so pair each player with the other
+        # one directly instead of searching the list
+        players = match["players"]
+        if len(players) == 2:
+            first, second = players
+            player_pairs = ((first, second["name"]), (second, first["name"]))
+        else:
+            player_pairs = [(player, None) for player in players]
+
+        for player, opponent_name in player_pairs:
             player_name = player["name"]
             if player_name in standings:
                 # Record opponent
-                opponent_name = next(
-                    (p["name"] for p in match["players"] if p["name"] != player_name),
-                    None,
-                )
-                if opponent_name:
+                if opponent_name and opponent_name != player_name:
                     standings[player_name]["opponents"].append(opponent_name)
 
                 # Record result
@@ -292,7 +392,7 @@ def calculate_standings(initial_seeding, match_results):
     return standings
 
 
-def get_expected_wins(seed):
+def _calculate_expected_wins(seed):
     """Calculate expected wins based on seed"""
     if seed <= 4:
         return 4.0 - (seed - 1) * 0.2  # Seeds 1-4: 4.0, 3.8, 3.6, 3.4
@@ -306,7 +406,7 @@ def get_expected_wins(seed):
         return 1.4 - (seed - 24) * 0.05  # Seeds 25-32: 1.35 down to 1.0
 
 
-def get_cinderella_multiplier(seed):
+def _calculate_cinderella_multiplier(seed):
     """Get Cinderella bonus multiplier based on seed"""
     if seed <= 8:
         return 0.5, "minimal (top seed)"
@@ -318,7 +418,57 @@ def get_cinderella_multiplier(seed):
         return 2.0, "maximum (bottom seed)"
 
 
-def calculate_cinderella_bonus(seed, wins, standings, match_results, player_name):
+# Lookup tables covering events of up to 64 players, indexed by seed
+LOOKUP_TABLE_SEEDS = 64
+EXPECTED_WINS_BY_SEED = tuple(
+    _calculate_expected_wins(seed) for seed in range(LOOKUP_TABLE_SEEDS + 1)
+)
+CINDERELLA_MULTIPLIER_BY_SEED = tuple(
+    _calculate_cinderella_multiplier(seed) for seed in range(LOOKUP_TABLE_SEEDS + 1)
+)
+
+# Upset tiers by seed gap: bisect_right(UPSET_SEED_GAPS, gap) indexes the
+# bonus/label tuples (tier 0 = not an upset)
+UPSET_SEED_GAPS = (8, 12, 16)
+UPSET_BONUSES = (0, 2, 3, 5)
+UPSET_LABELS = (None, "✨ Upset", "⭐ Big upset", "🌟 HUGE upset")
+
+
+def get_expected_wins(seed):
+    """Get expected wins for a seed, using the lookup table when possible"""
+    if 1 <= seed <= LOOKUP_TABLE_SEEDS:
+        return EXPECTED_WINS_BY_SEED[seed]
+    return _calculate_expected_wins(seed)
+
+
+def get_cinderella_multiplier(seed):
+    """Get Cinderella bonus multiplier, using the lookup table when possible"""
+    if 1 <= seed <= LOOKUP_TABLE_SEEDS:
+        return CINDERELLA_MULTIPLIER_BY_SEED[seed]
+    return _calculate_cinderella_multiplier(seed)
+
+
+def index_results_by_pair(match_results):
+    """Map (player, opponent) to the player's results against that opponent
+
+    Each value is a list of booleans (True for a win) in match order, so
+    head-to-head lookups don't need to scan every match.
+    """
+    results_by_pair = defaultdict(list)
+    for match in match_results:
+        winner_id = match["winner_id"]
+        for player in match["players"]:
+            for opponent in match["players"]:
+                if opponent["name"] != player["name"]:
+                    results_by_pair[(player["name"], opponent["name"])].append(
+                        player["id"] == winner_id
+                    )
+    return results_by_pair
+
+
+def calculate_cinderella_bonus(
+    seed, wins, standings, match_results, player_name, results_by_pair=None
+):
     """Calculate Cinderella bonus for a player"""
     expected_wins = get_expected_wins(seed)
     wins_above_expected = wins - expected_wins
@@ -340,42 +490,35 @@ def calculate_cinderella_bonus(seed, wins, standings, match_results, player_name
             cinderella_bonus += fractional_part * next_bonus
 
         # Special upset bonus
+        if results_by_pair is None:
+            results_by_pair = index_results_by_pair(match_results)
+
         upset_bonus = 0
         for opp_name in standings[player_name]["opponents"]:
             if opp_name in standings:
                 opp_seed = standings[opp_name]["seed"]
-                seed_diff = seed - opp_seed
-
-                if seed_diff >= 8:
-                    # Check if we actually beat them
-                    for match in match_results:
-                        match_players = [p["name"] for p in match["players"]]
-                        if player_name in match_players and opp_name in match_players:
-                            winner_id = match["winner_id"]
-                            player_id = next(
-                                (
-                                    p["id"]
-                                    for p in match["players"]
-                                    if p["name"] == player_name
-                                ),
-                                None,
-                            )
-                            if player_id == winner_id:
-                                if seed_diff >= 16:
-                                    upset_bonus += 5
-                                elif seed_diff >= 12:
-                                    upset_bonus += 3
-                                else:
-                                    upset_bonus += 2
-                                break
+                tier = bisect_right(UPSET_SEED_GAPS, seed - opp_seed)
+
+                # Check if we actually beat them
+                if tier and any(results_by_pair[(player_name, opp_name)]):
+                    upset_bonus += UPSET_BONUSES[tier]
 
         cinderella_bonus += upset_bonus
 
     # Cap Cinderella bonus at reasonable level
     return min(cinderella_bonus, 20.0)
 
+
+# Largest group the whole-group backtracking search is allowed to handle
+MAX_EXACT_MATCHING_SIZE = 20
+
+
 def calculate_swiss_pairings(standings, round_number=None):
     """Calculate Swiss pairings with improved rematch avoidance"""
+    # Progress output is collected and printed once at the end rather than
+    # writing to stdout from inside the pairing loops
+    lines = []
+
     # Group players by record
     groups = defaultdict(list)
     for player_name, info in standings.items():
@@ -387,9 +530,9 @@ def calculate_swiss_pairings(standings, round_number=None):
         groups.items(), key=lambda x: (x[0][0], -x[0][1]), reverse=True
     )
 
-    print("\nPlayer groups by record:")
+    lines.append("\nPlayer groups by record:")
     for record, players in sorted_groups:
-        print(f"  {record[0]}-{record[1]}: {len(players)} players")
+        lines.append(f"  {record[0]}-{record[1]}: {len(players)} players")
 
     # Check if this is the final round (round 5)
     is_final_round = False
@@ -401,12 +544,23 @@ def calculate_swiss_pairings(standings, round_number=None):
             )
             is_final_round = total_games_played == 4
 
-    pairings = []
     used = set()
+    allow_exact_search = False
+
+    # Give every player a bit and record who they have played as a bitmask,
+    # so a rematch check done in every pairing attempt is a single shift
+    player_bits = {player_name: 1 << i for i, player_name in enumerate(standings)}
+    played_masks = dict.fromkeys(standings, 0)
+    for player_name, info in standings.items():
+        for opp_name in info["opponents"]:
+            if opp_name in player_bits:
+                # Mark both directions so one lookup covers either record
+                played_masks[player_name] |= player_bits[opp_name]
+                played_masks[opp_name] |= player_bits[player_name]
 
     def can_pair(p1, p2):
         """Check if two players can be paired (haven't played before)"""
-        return p2[0] not in p1[1]["opponents"] and p1[0] not in p2[1]["opponents"]
+        return not played_masks[p1[0]] & player_bits[p2[0]]
 
     def find_valid_pairing_for_group(players_list):
         """
@@ -427,44 +581,47 @@ def calculate_swiss_pairings(standings, round_number=None):
         # For larger groups, use the optimized algorithm
         return find_perfect_matching_large_group(players_list)
 
-    def find_perfect_matching_backtrack(players, current_matching=None, used_players=None):
+    def find_perfect_matching_backtrack(players, prefer_close_seeds=False):
         """
         Backtracking algorithm to find a perfect matching without rematches.
+        Remaining players are tracked as a bitmask and masks with no
+        solution are memoized, so each subproblem is only explored once
+        (O(2^n * n) instead of factorial). With prefer_close_seeds,
+        partners with the closest seed are tried first.
         """
-        if current_matching is None:
-            current_matching = []
-        if used_players is None:
-            used_players = set()
-        
-        # Base case: all players are paired
-        if len(used_players) == len(players):
-            return current_matching
-        
-        # Find first unpaired player
-        p1 = None
-        for player in players:
-            if player[0] not in used_players:
-                p1 = player
-                break
-        
-        if p1 is None:
-            return current_matching
-        
-        # Try pairing with each valid opponent
-        for p2 in players:
-            if p2[0] not in used_players and p1[0] != p2[0] and can_pair(p1, p2):
-                # Try this pairing
-                new_matching = current_matching + [(p1, p2)]
-                new_used = used_players | {p1[0], p2[0]}
-                
-                # Recursively try to pair remaining players
-                result = find_perfect_matching_backtrack(players, new_matching, new_used)
-                
-                if result is not None and len(result) * 2 == len(players):
-                    return result
-        
-        # No valid pairing found with p1
-        return None
+        n = len(players)
+        if n % 2 != 0:
+            return None
+
+        partners = [
+            [j for j in range(n) if j != i and can_pair(players[i], players[j])]
+            for i in range(n)
+        ]
+        if prefer_close_seeds:
+            for i, options in enumerate(partners):
+                options.sort(
+                    key=lambda j: abs(players[i][1]["seed"] - players[j][1]["seed"])
+                )
+        unsolvable = set()
+
+        def solve(remaining):
+            if not remaining:
+                return []
+            if remaining in unsolvable:
+                return None
+
+            # Pair the first unpaired player
+            i = (remaining & -remaining).bit_length() - 1
+            for j in partners[i]:
+                if remaining >> j & 1:
+                    rest = solve(remaining & ~(1 << i) & ~(1 << j))
+                    if rest is not None:
+                        return [(players[i], players[j])] + rest
+
+            unsolvable.add(remaining)
+            return None
+
+        return solve((1 << n) - 1)
 
     def find_perfect_matching_large_group(players):
         """
@@ -495,38 +652,45 @@ def calculate_swiss_pairings(standings, round_number=None):
             return swiss_pairs
         
         # Strategy 2: Minimum weight matching based on seed difference
-        # Build adjacency matrix
-        valid_pairings = []
-        for i in range(n):
-            for j in range(i + 1, n):
-                if can_pair(players[i], players[j]):
-                    weight = abs(players[i][1]["seed"] - players[j][1]["seed"])
-                    valid_pairings.append((i, j, weight))
+        # Build adjacency list as (weight, i, j); pairs are generated in
+        # (i, j) order, so a plain tuple sort orders them exactly like a
+        # stable sort on weight alone
+        seeds = [player[1]["seed"] for player in players]
+        valid_pairings = [
+            (abs(seeds[i] - seeds[j]), i, j)
+            for i in range(n)
+            for j in range(i + 1, n)
+            if can_pair(players[i], players[j])
+        ]
         
         # Sort by weight (seed difference)
-        valid_pairings.sort(key=lambda x: x[2])
+        valid_pairings.sort()
         
         # Greedy matching
-        matched = set()
+        matched = bytearray(n)
         result_pairs = []
         
-        for i, j, weight in valid_pairings:
-            if i not in matched and j not in matched:
+        for weight, i, j in valid_pairings:
+            if not matched[i] and not matched[j]:
                 result_pairs.append((players[i], players[j]))
-                matched.add(i)
-                matched.add(j)
+                matched[i] = matched[j] = 1
                 
                 if len(result_pairs) == half:
                     return result_pairs
         
         # Strategy 3: If still no complete matching, use backtracking for remaining
         if len(result_pairs) > half - 2:  # Almost complete
-            remaining = [p for i, p in enumerate(players) if i not in matched]
+            remaining = [p for i, p in enumerate(players) if not matched[i]]
             if len(remaining) <= 4:
                 remaining_pairs = find_perfect_matching_backtrack(remaining)
                 if remaining_pairs:
                     return result_pairs + remaining_pairs
         
+        # Strategy 4: Exact search over the whole group (bounded size), only
+        # when the caller asks for it - see pair_round below
+        if allow_exact_search and n <= MAX_EXACT_MATCHING_SIZE:
+            return find_perfect_matching_backtrack(players, prefer_close_seeds=True)
+
         return None
 
     def pair_within_group_swiss_style(players_in_group, record):
@@ -536,7 +700,7 @@ def calculate_swiss_pairings(standings, round_number=None):
         if len(available) < 2:
             return []
         
-        print(f"\nPairing {record[0]}-{record[1]} group ({len(available)} players):")
+        lines.append(f"\nPairing {record[0]}-{record[1]} group ({len(available)} players):")
         
         # Handle odd number - hold out middle player
         held_out_player = None
@@ -559,13 +723,13 @@ def calculate_swiss_pairings(standings, round_number=None):
             if best_player:
                 held_out_player = best_player
                 available.remove(held_out_player)
-                print(f"    Holding {held_out_player[0]} for cross-group pairing (has {best_flexibility} valid opponents)")
+                lines.append(f"    Holding {held_out_player[0]} for cross-group pairing (has {best_flexibility} valid opponents)")
         
         # Try to find a perfect matching for the group
         group_pairings = find_valid_pairing_for_group(available)
         
         if group_pairings is None:
-            print(f"    ⚠️  Could not find perfect matching for group, using fallback")
+            lines.append(f"    ⚠️  Could not find perfect matching for group, using fallback")
             # Fallback to original algorithm
             group_pairings = []
             temp_available = available[:]
@@ -585,10 +749,10 @@ def calculate_swiss_pairings(standings, round_number=None):
                     temp_available.remove(best_opponent)
                 else:
                     # This should be very rare
-                    print(f"    ⚠️  No valid opponent for {p1[0]} in group")
+                    lines.append(f"    ⚠️  No valid opponent for {p1[0]} in group")
                     break
         else:
-            print(f"    ✓ Found perfect matching for group")
+            lines.append(f"    ✓ Found perfect matching for group")
         
         # Add the held out player back to unpaired list if needed
         if held_out_player:
@@ -597,82 +761,110 @@ def calculate_swiss_pairings(standings, round_number=None):
         
         return group_pairings
 
-    # Process each score group
-    unpaired_players = []
-    
-    for record, players in sorted_groups:
-        group_pairings = pair_within_group_swiss_style(players, record)
+    def pair_round():
+        """Pair each score group, then cross-pair whoever is left over"""
+        round_pairings = []
+        unpaired_players = []
+
+        # Process each score group
+        for record, players in sorted_groups:
+            group_pairings = pair_within_group_swiss_style(players, record)
         
-        # Mark paired players as used
-        for p1, p2 in group_pairings:
-            used.add(p1[0])
-            used.add(p2[0])
-            print(f"    ✓ {p1[0]} vs {p2[0]}")
+            # Mark paired players as used
+            for p1, p2 in group_pairings:
+                used.add(p1[0])
+                used.add(p2[0])
+                lines.append(f"    ✓ {p1[0]} vs {p2[0]}")
         
-        pairings.extend(group_pairings)
+            round_pairings.extend(group_pairings)
         
-        # Collect unpaired players from this group
-        for player in players:
-            if player[0] not in used:
-                unpaired_players.append(player)
-
-    # Handle remaining unpaired players with cross-group pairing
-    if unpaired_players:
-        print(f"\nCross-group pairings for {len(unpaired_players)} remaining players:")
+            # Collect unpaired players from this group
+            for player in players:
+                if player[0] not in used:
+                    unpaired_players.append(player)
+
+        # Handle remaining unpaired players with cross-group pairing
+        if unpaired_players:
+            lines.append(f"\nCross-group pairings for {len(unpaired_players)} remaining players:")
         
-        # Sort by performance (wins - losses) and seed
-        unpaired_players.sort(
-            key=lambda x: (-(x[1]["wins"] - x[1]["losses"]), x[1]["seed"])
-        )
+            # Sort by performance (wins - losses) and seed
+            unpaired_players.sort(
+                key=lambda x: (-(x[1]["wins"] - x[1]["losses"]), x[1]["seed"])
+            )
         
-        # Try to pair them optimally
-        cross_group_pairs = find_valid_pairing_for_group(unpaired_players)
+            # Try to pair them optimally
+            cross_group_pairs = find_valid_pairing_for_group(unpaired_players)
         
-        if cross_group_pairs:
-            for p1, p2 in cross_group_pairs:
-                pairings.append((p1, p2))
-                used.add(p1[0])
-                used.add(p2[0])
-                print(f"  ✓ {p1[0]} ({p1[1]['wins']}-{p1[1]['losses']}) vs {p2[0]} ({p2[1]['wins']}-{p2[1]['losses']})")
-        else:
-            # Last resort: pair any remaining players
-            print("  ⚠️  Could not find valid cross-group pairings, using fallback")
-            i = 0
-            while i < len(unpaired_players) - 1:
-                p1 = unpaired_players[i]
-                p2 = unpaired_players[i + 1]
-                pairings.append((p1, p2))
-                used.add(p1[0])
-                used.add(p2[0])
+            if cross_group_pairs:
+                for p1, p2 in cross_group_pairs:
+                    round_pairings.append((p1, p2))
+                    used.add(p1[0])
+                    used.add(p2[0])
+                    lines.append(f"  ✓ {p1[0]} ({p1[1]['wins']}-{p1[1]['losses']}) vs {p2[0]} ({p2[1]['wins']}-{p2[1]['losses']})")
+            else:
+                # Last resort: pair any remaining players
+                lines.append("  ⚠️  Could not find valid cross-group pairings, using fallback")
+                i = 0
+                while i < len(unpaired_players) - 1:
+                    p1 = unpaired_players[i]
+                    p2 = unpaired_players[i + 1]
+                    round_pairings.append((p1, p2))
+                    used.add(p1[0])
+                    used.add(p2[0])
                 
-                if can_pair(p1, p2):
-                    print(f"  ✓ {p1[0]} vs {p2[0]}")
-                else:
-                    print(f"  ⚠️  FORCED REMATCH: {p1[0]} vs {p2[0]}")
+                    if can_pair(p1, p2):
+                        lines.append(f"  ✓ {p1[0]} vs {p2[0]}")
+                    else:
+                        lines.append(f"  ⚠️  FORCED REMATCH: {p1[0]} vs {p2[0]}")
                 
-                i += 2
+                    i += 2
+
+        return round_pairings
+
+    def count_rematches(round_pairings):
+        """Count pairings between players who have already played"""
+        return sum(1 for p1, p2 in round_pairings if not can_pair(p1, p2))
+
+    # Solving one large group exactly changes who is left over for
+    # cross-group pairing, so it can make the round as a whole worse. Pair
+    # without it first, and only when that forces a rematch retry with the
+    # exact search, keeping the result only if it has fewer rematches
+    log_start = len(lines)
+    pairings = pair_round()
+    if count_rematches(pairings):
+        first_attempt_lines = lines[log_start:]
+        del lines[log_start:]
+        used.clear()
+        allow_exact_search = True
+        exact_pairings = pair_round()
+        if count_rematches(exact_pairings) < count_rematches(pairings):
+            pairings = exact_pairings
+        else:
+            lines[log_start:] = first_attempt_lines
 
     # Final verification
-    print(f"\nTotal pairings: {len(pairings)} (expected: {len(standings) // 2})")
+    lines.append(f"\nTotal pairings: {len(pairings)} (expected: {len(standings) // 2})")
     
     # Verify no rematches
-    print("\n🔍 Verifying no rematches...")
+    lines.append("\n🔍 Verifying no rematches...")
     rematch_count = 0
     forced_rematches = []
     
-    for (p1_name, p1_info), (p2_name, p2_info) in pairings:
-        if p2_name in p1_info["opponents"] or p1_name in p2_info["opponents"]:
+    for p1, p2 in pairings:
+        if not can_pair(p1, p2):
+            p1_name, p2_name = p1[0], p2[0]
             rematch_count += 1
             forced_rematches.append((p1_name, p2_name))
-            print(f"  ⚠️  REMATCH DETECTED: {p1_name} vs {p2_name}")
+            lines.append(f"  ⚠️  REMATCH DETECTED: {p1_name} vs {p2_name}")
     
     if rematch_count == 0:
-        print("  ✅ No rematches found - all pairings are valid!")
+        lines.append("  ✅ No rematches found - all pairings are valid!")
     else:
-        print(f"  ❌ Found {rematch_count} rematch(es)")
-        print("     This should only happen if mathematically unavoidable")
-        print("     Check if the tournament structure allows for valid pairings")
-    
+        lines.append(f"  ❌ Found {rematch_count} rematch(es)")
+        lines.append("     This should only happen if mathematically unavoidable")
+        lines.append("     Check if the tournament structure allows for valid pairings")
+
+    print("\n".join(lines))
     return pairings
 
 def update_phase_seeding_for_pairings(phase_id, phase_groups, pairings):
@@ -687,11 +879,11 @@ def update_phase_seeding_for_pairings(phase_id, phase_groups, pairings):
 
     print(f"\nCurrent seeds in phase: {len(current_seeds)}")
 
-    # Build mappings
-    seed_id_by_name = {}
-    for seed in current_seeds:
-        name = seed["entrant"]["participants"][0]["gamerTag"]
-        seed_id_by_name[name] = seed["id"]
+    # Build mappings (gamer tags are read once and reused below)
+    seed_names = [
+        seed["entrant"]["participants"][0]["gamerTag"] for seed in current_seeds
+    ]
+    seed_id_by_name = {name: seed["id"] for name, seed in zip(seed_names, current_seeds)}
 
     # Calculate total number of players
     total_players = len(current_seeds)
@@ -699,11 +891,13 @@ def update_phase_seeding_for_pairings(phase_id, phase_groups, pairings):
 
     # Create new seed mapping
     new_seed_mapping = []
-    assigned_positions = set()
+    # Bitmap of taken positions; sized for every position a pairing could
+    # be given, even when players missing from the phase shift pairs down
+    assigned_positions = bytearray(max(total_players, len(pairings) + half_players) + 1)
 
     print("\nAssigning new positions based on StartGG bracket structure:")
 
-    for match_idx, ((p1_name, p1_info), (p2_name, p2_info)) in enumerate(pairings):
+    for match_num, ((p1_name, p1_info), (p2_name, p2_info)) in enumerate(pairings, 1):
         p1_seed_id = seed_id_by_name.get(p1_name)
         p2_seed_id = seed_id_by_name.get(p2_name)
 
@@ -711,36 +905,33 @@ def update_phase_seeding_for_pairings(phase_id, phase_groups, pairings):
             print(f"Warning: Could not find seed ID for {p1_name} or {p2_name}")
             continue
 
-        pos1 = match_idx + 1  # Top half
-        pos2 = match_idx + half_players + 1  # Bottom half
+        pos1 = match_num  # Top half
+        pos2 = match_num + half_players  # Bottom half
 
         print(
-            f"  Match {match_idx + 1}: {p1_name} -> position {pos1}, {p2_name} -> position {pos2}"
+            f"  Match {match_num}: {p1_name} -> position {pos1}, {p2_name} -> position {pos2}"
         )
 
         new_seed_mapping.append({"seedId": p1_seed_id, "seedNum": pos1})
         new_seed_mapping.append({"seedId": p2_seed_id, "seedNum": pos2})
 
-        assigned_positions.add(pos1)
-        assigned_positions.add(pos2)
+        assigned_positions[pos1] = 1
+        assigned_positions[pos2] = 1
 
     # Handle any unpaired players
-    paired_players = set()
-    for (p1_name, _), (p2_name, _) in pairings:
-        paired_players.add(p1_name)
-        paired_players.add(p2_name)
-
-    unpaired_players = []
-    for seed in current_seeds:
-        name = seed["entrant"]["participants"][0]["gamerTag"]
-        if name not in paired_players:
-            unpaired_players.append((name, seed["id"]))
+    paired_players = {player[0] for pairing in pairings for player in pairing}
+    unpaired_players = [
+        (name, seed["id"])
+        for name, seed in zip(seed_names, current_seeds)
+        if name not in paired_players
+    ]
 
     if unpaired_players:
         print(f"\nFound {len(unpaired_players)} unpaired players")
 
-        all_positions = set(range(1, total_players + 1))
-        available_positions = sorted(all_positions - assigned_positions)
+        available_positions = [
+            pos for pos in range(1, total_players + 1) if not assigned_positions[pos]
+        ]
 
         for i, (player_name, seed_id) in enumerate(unpaired_players):
             if i < len(available_positions):
@@ -792,42 +983,41 @@ def calculate_final_standings_points_based(initial_seeding, match_results):
     final_standings = []
     total_players = len(initial_seeding)
 
+    # Base points only depend on seed, so compute them once per player and
+    # reuse them for every opponent lookup below
+    base_points_by_name = {
+        name: total_players - (info["seed"] - 1) for name, info in standings.items()
+    }
+    results_by_pair = index_results_by_pair(match_results)
+
     for player_name, info in standings.items():
         # Base points from initial seeding
-        base_points = total_players - (info["seed"] - 1)
+        base_points = base_points_by_name[player_name]
 
         # Calculate quality points from wins and losses
         win_points = 0
         loss_points = 0
 
         for opp_name in info["opponents"]:
-            if opp_name in standings:
-                opp_seed = standings[opp_name]["seed"]
-                opp_base_points = total_players - (opp_seed - 1)
+            if opp_name in base_points_by_name:
+                opp_base_points = base_points_by_name[opp_name]
 
                 # Check if this was a win or loss
-                for match in match_results:
-                    match_players = [p["name"] for p in match["players"]]
-                    if player_name in match_players and opp_name in match_players:
-                        winner_id = match["winner_id"]
-                        player_id = next(
-                            (
-                                p["id"]
-                                for p in match["players"]
-                                if p["name"] == player_name
-                            ),
-                            None,
-                        )
-
-                        if player_id == winner_id:
-                            win_points += opp_base_points * 0.1
-                        else:
-                            loss_penalty = (total_players - opp_base_points + 1) * 0.05
-                            loss_points -= loss_penalty
+                for won in results_by_pair[(player_name, opp_name)]:
+                    if won:
+                        win_points += opp_base_points * 0.1
+                    else:
+                        loss_penalty = (total_players - opp_base_points + 1) * 0.05
+                        loss_points -= loss_penalty
 
         # Calculate Cinderella bonus
         cinderella_bonus = calculate_cinderella_bonus(
-            info["seed"], info["wins"], standings, match_results, player_name
+            info["seed"],
+            info["wins"],
+            standings,
+            match_results,
+            player_name,
+            results_by_pair,
         )
 
         # Total score
@@ -855,50 +1045,59 @@ def calculate_final_standings_points_based(initial_seeding, match_results):
                 "expected_wins": expected_wins,
                 "wins_above_expected": wins_above_expected,
                 "total_score": total_score,
-                "opponents": info["opponents"],
+                # Only used for rematch membership tests from here on
+                "opponents": frozenset(info["opponents"]),
             }
         )
 
-    # Sort within record groups first, then by total score
-    record_groups = defaultdict(list)
-    for player in final_standings:
-        record = (player["wins"], player["losses"])
-        record_groups[record].append(player)
-
-    # Sort each record group by total score
-    for record in record_groups:
-        record_groups[record].sort(key=lambda x: (-x["total_score"], x["initial_seed"]))
-
-    # Rebuild final standings maintaining record groups in order
-    sorted_standings = []
-    for record in sorted(record_groups.keys(), key=lambda x: (-x[0], x[1])):
-        sorted_standings.extend(record_groups[record])
+    # Sort by record group first (most wins, fewest losses), then by total
+    # score and initial seed within each group - one sort over a composite key
+    final_standings.sort(
+        key=lambda x: (-x["wins"], x["losses"], -x["total_score"], x["initial_seed"])
+    )
 
-    return sorted_standings
+    return final_standings
 
 
 def find_best_bracket_arrangement(players, bracket_name):
     """Find the best bracket arrangement to minimize rematches"""
-    best_arrangement = players[:]
-    best_rematch_count = count_bracket_rematches(best_arrangement)
+    # Work on player indices and played-opponent bitmasks so each rematch
+    # check is a single shift, and a swap only rescores the matches it touches
+    played_masks = build_played_masks(players)
+    arrangement = list(range(len(players)))
+    best_rematch_count = count_bracket_rematches(arrangement, played_masks)
 
     if best_rematch_count == 0:
-        return best_arrangement, best_rematch_count
+        return players[:], best_rematch_count
 
     print(f"\n  Initial {bracket_name} bracket has {best_rematch_count} rematch(es)")
 
+    def is_rematch(match_idx):
+        """Check whether a first round match (0-7) is a rematch"""
+        return played_masks[arrangement[match_idx]] >> arrangement[15 - match_idx] & 1
+
+    def try_swap(i, j):
+        """Swap positions i and j if that reduces rematches; return whether it did"""
+        nonlocal best_rematch_count
+
+        # Positions 0-15 belong to match min(p, 15 - p); later ones to none
+        matches = {min(p, 15 - p) for p in (i, j) if p < 16}
+        before = sum(is_rematch(m) for m in matches)
+        if before == 0:
+            return False  # Neither match is a rematch, so a swap cannot help
+
+        arrangement[i], arrangement[j] = arrangement[j], arrangement[i]
+        after = sum(is_rematch(m) for m in matches)
+        if after < before:
+            best_rematch_count += after - before
+            return True
+
+        arrangement[i], arrangement[j] = arrangement[j], arrangement[i]
+        return False
+
     # Try swapping adjacent players
     for i in range(len(players) - 1):
-        test_arrangement = best_arrangement[:]
-        test_arrangement[i], test_arrangement[i + 1] = (
-            test_arrangement[i + 1],
-            test_arrangement[i],
-        )
-
-        rematch_count = count_bracket_rematches(test_arrangement)
-        if rematch_count < best_rematch_count:
-            best_arrangement = test_arrangement[:]
-            best_rematch_count = rematch_count
+        if try_swap(i, i + 1):
             print(
                 f"  Swapped positions {i+1} and {i+2} to reduce rematches to {best_rematch_count}"
             )
@@ -909,40 +1108,96 @@ def find_best_bracket_arrangement(players, bracket_name):
 
         for i in range(len(players)):
             for j in range(i + 2, min(i + 5, len(players))):
-                if abs(players[i]["total_score"] - players[j]["total_score"]) < 10:
-                    test_arrangement = best_arrangement[:]
-                    test_arrangement[i], test_arrangement[j] = (
-                        test_arrangement[j],
-                        test_arrangement[i],
-                    )
+                if abs(players[i]["total_score"] - players[j]["total_score"]) >= 10:
+                    continue
 
-                    rematch_count = count_bracket_rematches(test_arrangement)
-                    if rematch_count < best_rematch_count:
-                        best_arrangement = test_arrangement[:]
-                        best_rematch_count = rematch_count
-                        print(
-                            f"  Swapped positions {i+1} and {j+1} to reduce rematches to {best_rematch_count}"
-                        )
+                if try_swap(i, j):
+                    print(
+                        f"  Swapped positions {i+1} and {j+1} to reduce rematches to {best_rematch_count}"
+                    )
 
-                        if best_rematch_count == 0:
-                            break
+                    if best_rematch_count == 0:
+                        break
             if best_rematch_count == 0:
                 break
 
-    return best_arrangement, best_rematch_count
+    # If rematches are left, re-pair the first round exactly: keep the top
+    # half in place and find the assignment of bottom-half players with the
+    # fewest rematches, moving them as short a distance as possible
+    if best_rematch_count > 0:
+        top, bottom = arrangement[:8], arrangement[8:16]
+
+        def can_move(k, slot):
+            """Check bottom player k can move to bottom slot without passing
+            anyone from another record group or 10+ points away (the same
+            guard the aggressive swaps use)"""
+            player = players[bottom[k]]
+            return all(
+                (other["wins"], other["losses"]) == (player["wins"], player["losses"])
+                and abs(other["total_score"] - player["total_score"]) < 10
+                for other in (
+                    players[bottom[c]] for c in range(min(k, slot), max(k, slot) + 1)
+                )
+            )
+
+        def assignment_cost(i, k):
+            """Cost of facing top player i with bottom player k (rematches first)"""
+            rematch = played_masks[top[i]] >> bottom[k] & 1
+            # bottom[k] moves from position 8 + k to 15 - i; a rematch costs
+            # more than the largest total distance moved (32)
+            return rematch * 64 + abs(7 - i - k)
+
+        # Bitmask DP over the bottom players already assigned to top[0..i-1].
+        # Leaving everyone in place is always allowed, so a full assignment
+        # always exists
+        allowed = [[can_move(k, 7 - i) for k in range(8)] for i in range(8)]
+        best_cost = [None] * 256
+        best_choice = [None] * 256
+        best_cost[0] = 0
+        for mask in range(255):
+            if best_cost[mask] is None:
+                continue
+            i = bin(mask).count("1")
+            for k in range(8):
+                if not mask >> k & 1 and allowed[i][k]:
+                    cost = best_cost[mask] + assignment_cost(i, k)
+                    next_mask = mask | 1 << k
+                    if best_cost[next_mask] is None or cost < best_cost[next_mask]:
+                        best_cost[next_mask] = cost
+                        best_choice[next_mask] = k
+
+        rematch_count = best_cost[255] // 64
+        if rematch_count < best_rematch_count:
+            mask = 255
+            for i in range(7, -1, -1):
+                k = best_choice[mask]
+                arrangement[15 - i] = bottom[k]
+                mask &= ~(1 << k)
+            best_rematch_count = rematch_count
+            print(
+                f"  Re-paired bottom half of first round to reduce rematches to {best_rematch_count}"
+            )
+
+    return [players[k] for k in arrangement], best_rematch_count
 
 
-def count_bracket_rematches(players):
-    """Count potential first round rematches in a 16-player bracket"""
-    rematches = 0
-    for i in range(8):
-        p1 = players[i]
-        p2 = players[15 - i]
+def build_played_masks(players):
+    """Per-player bitmask of previous opponents (bit j set = played players[j])"""
+    bit_by_name = {player["name"]: 1 << k for k, player in enumerate(players)}
+    played_masks = []
+    for player in players:
+        mask = 0
+        for opp_name in player["opponents"]:
+            mask |= bit_by_name.get(opp_name, 0)
+        played_masks.append(mask)
+    return played_masks
 
-        if p2["name"] in p1["opponents"]:
-            rematches += 1
 
-    return rematches
+def count_bracket_rematches(arrangement, played_masks):
+    """Count potential first round rematches in a 16-player bracket (player indices)"""
+    return sum(
+        played_masks[arrangement[i]] >> arrangement[15 - i] & 1 for i in range(8)
+    )
 
 
 def generate_bracket_seeding(final_standings):
@@ -953,17 +1208,16 @@ def generate_bracket_seeding(final_standings):
 
     # Group players by record for display
     record_groups = defaultdict(list)
-    for player in final_standings:
+    for overall_rank, player in enumerate(final_standings, 1):
         record = (player["wins"], player["losses"])
-        record_groups[record].append(player)
+        record_groups[record].append((overall_rank, player))
 
     print("\nFinal standings by record (with point breakdown):")
     for record, players in sorted(
         record_groups.items(), key=lambda x: (-x[0][0], x[0][1])
     ):
         print(f"\n  {record[0]}-{record[1]}: {len(players)} players")
-        for player in players:
-            overall_rank = final_standings.index(player) + 1
+        for overall_rank, player in players:
             cinderella_text = ""
             if player["cinderella_bonus"] > 0:
                 cinderella_text = f" + {player['cinderella_bonus']:.0f} Cinderella"
@@ -1013,12 +1267,14 @@ def generate_bracket_seeding(final_standings):
         for i in range(8):
             p1 = players[i]
             p2 = players[15 - i]
+            p1_name, p2_name = p1["name"], p2["name"]
 
-            status = "REMATCH!" if p2["name"] in p1["opponents"] else "OK"
-            print(f"  Match {i+1}: {p1['name']} vs {p2['name']} - {status}")
+            is_rematch = p2_name in p1["opponents"]
+            status = "REMATCH!" if is_rematch else "OK"
+            print(f"  Match {i+1}: {p1_name} vs {p2_name} - {status}")
 
-            if p2["name"] in p1["opponents"]:
-                rematches.append((i + 1, 16 - i, p1["name"], p2["name"]))
+            if is_rematch:
+                rematches.append((i + 1, 16 - i, p1_name, p2_name))
 
         return rematches
 
@@ -1048,56 +1304,53 @@ def recommend_stream_matches(pairings, standings):
     if pairings:
         sample_player = pairings[0][0][1]
         current_round = sample_player["wins"] + sample_player["losses"] + 1
+    rounds_played = current_round - 1
 
     for i, ((p1_name, p1_info), (p2_name, p2_info)) in enumerate(pairings, 1):
         hype_score = 0
         reasons = []
 
-        # Calculate performance vs expectation
-        p1_expected_wins = 2.5 - (p1_info["seed"] - 16.5) * 0.06
-        p2_expected_wins = 2.5 - (p2_info["seed"] - 16.5) * 0.06
-        p1_overperformance = p1_info["wins"] - (
-            p1_expected_wins * (current_round - 1) / 5
+        # Read each player's fields once - every factor below uses them
+        p1_seed, p1_wins, p1_losses = (
+            p1_info["seed"],
+            p1_info["wins"],
+            p1_info["losses"],
         )
-        p2_overperformance = p2_info["wins"] - (
-            p2_expected_wins * (current_round - 1) / 5
+        p2_seed, p2_wins, p2_losses = (
+            p2_info["seed"],
+            p2_info["wins"],
+            p2_info["losses"],
         )
 
+        # Calculate performance vs expectation
+        p1_expected_wins = 2.5 - (p1_seed - 16.5) * 0.06
+        p2_expected_wins = 2.5 - (p2_seed - 16.5) * 0.06
+        p1_overperformance = p1_wins - (p1_expected_wins * rounds_played / 5)
+        p2_overperformance = p2_wins - (p2_expected_wins * rounds_played / 5)
+
         # Factor 1: CRITICAL MATCHES (round 5 bracket qualification)
         if current_round == 5:
-            if (
-                p1_info["wins"] == 2
-                and p1_info["losses"] == 2
-                and p2_info["wins"] == 2
-                and p2_info["losses"] == 2
-            ):
+            if p1_wins == 2 and p1_losses == 2 and p2_wins == 2 and p2_losses == 2:
                 hype_score += 50  # Highest priority
                 reasons.append("🏆 BRACKET QUALIFICATION ON THE LINE")
-            elif (p1_info["wins"] == 3 and p2_info["wins"] == 3) or (
-                p1_info["wins"] == 1 and p2_info["wins"] == 1
-            ):
+            elif (p1_wins == 3 and p2_wins == 3) or (p1_wins == 1 and p2_wins == 1):
                 hype_score += 30
                 reasons.append("🎯 Final round seeding implications")
 
         # Factor 2: Mid-tournament elimination pressure
         elif current_round >= 3:
-            if p1_info["losses"] == 2 and p2_info["losses"] == 2:
+            if p1_losses == 2 and p2_losses == 2:
                 hype_score += 35
                 reasons.append("💀 Elimination zone battle")
-            elif (
-                p1_info["wins"] == 2
-                and p1_info["losses"] == 0
-                and p2_info["wins"] == 2
-                and p2_info["losses"] == 0
-            ):
+            elif p1_wins == 2 and p1_losses == 0 and p2_wins == 2 and p2_losses == 0:
                 hype_score += 30
                 reasons.append("🔥 Clash of the undefeated")
 
         # Factor 3: Cinderella stories (lower seeds overperforming)
         cinderella_factor = 0
-        if p1_info["seed"] >= 17 and p1_overperformance >= 0.5:
+        if p1_seed >= 17 and p1_overperformance >= 0.5:
             cinderella_factor += 1
-        if p2_info["seed"] >= 17 and p2_overperformance >= 0.5:
+        if p2_seed >= 17 and p2_overperformance >= 0.5:
             cinderella_factor += 1
 
         if cinderella_factor == 2:
@@ -1108,43 +1361,38 @@ def recommend_stream_matches(pairings, standings):
             reasons.append("🌟 Cinderella story")
 
         # Factor 4: Mid-tier mayhem (seeds 9-24 competing for bracket spots)
-        if 9 <= p1_info["seed"] <= 24 and 9 <= p2_info["seed"] <= 24:
+        if 9 <= p1_seed <= 24 and 9 <= p2_seed <= 24:
             # These players are fighting for main bracket spots
             hype_score += 15
             reasons.append("⚔️ Mid-tier bracket battle")
 
         # Factor 5: David vs Goliath matches
-        seed_diff = abs(p1_info["seed"] - p2_info["seed"])
+        seed_diff = abs(p1_seed - p2_seed)
         if seed_diff >= 12:
-            lower_seed = p1_info if p1_info["seed"] > p2_info["seed"] else p2_info
-            higher_seed = p2_info if p1_info["seed"] > p2_info["seed"] else p1_info
-
             # Big seed difference matches are inherently interesting
             hype_score += 15
             reasons.append("👑 David vs Goliath")
 
             # Extra points if the lower seed is overperforming expectations
-            if lower_seed == p1_info and p1_overperformance >= 0.5:
-                hype_score += 5
-                reasons.append("🌟 Underdog overperforming")
-            elif lower_seed == p2_info and p2_overperformance >= 0.5:
+            underdog_overperformance = (
+                p1_overperformance if p1_seed > p2_seed else p2_overperformance
+            )
+            if underdog_overperformance >= 0.5:
                 hype_score += 5
                 reasons.append("🌟 Underdog overperforming")
 
         # Factor 6: Momentum clashes
-        if p1_info["wins"] >= 2 and p2_info["wins"] >= 2 and current_round >= 3:
+        if p1_wins >= 2 and p2_wins >= 2 and current_round >= 3:
             hype_score += 10
             reasons.append("🚀 High momentum clash")
 
         # Factor 7: Redemption stories (good players bouncing back)
-        if (p1_info["seed"] <= 12 and p1_info["losses"] >= 2) or (
-            p2_info["seed"] <= 12 and p2_info["losses"] >= 2
-        ):
+        if (p1_seed <= 12 and p1_losses >= 2) or (p2_seed <= 12 and p2_losses >= 2):
             hype_score += 8
             reasons.append("💪 Redemption opportunity")
 
         # PENALTY for top seeds in early rounds (they'll get stream time in brackets)
-        if current_round <= 3 and (p1_info["seed"] <= 4 or p2_info["seed"] <= 4):
+        if current_round <= 3 and (p1_seed <= 4 or p2_seed <= 4):
             hype_score -= 10
             # Don't add this as a reason, just silently deprioritize
 
@@ -1152,11 +1400,8 @@ def recommend_stream_matches(pairings, standings):
             {
                 "match_num": i,
                 "players": (p1_name, p2_name),
-                "records": (
-                    f"{p1_info['wins']}-{p1_info['losses']}",
-                    f"{p2_info['wins']}-{p2_info['losses']}",
-                ),
-                "seeds": (p1_info["seed"], p2_info["seed"]),
+                "records": (f"{p1_wins}-{p1_losses}", f"{p2_wins}-{p2_losses}"),
+                "seeds": (p1_seed, p2_seed),
                 "hype_score": max(0, hype_score),  # Don't go negative
                 "reasons": reasons,
                 "round": current_round,
@@ -1215,63 +1460,59 @@ def get_bracket_results(bracket_phase):
         print(f"⚠️  {bracket_phase['name']} is not completed yet")
         return {}
 
-    bracket_results = {}
+    bracket_results = defaultdict(
+        lambda: {"wins": 0, "losses": 0, "final_round": 0, "eliminated_by": None}
+    )
     match_count = {}  # Track how many times we've seen each match
 
     for group in bracket_phase["phaseGroups"]["nodes"]:
         for set_data in group["sets"]["nodes"]:
-            if get_phase_state(set_data["state"]) == 3 and set_data.get("winnerId"):
-                # Create a unique match key to avoid counting the same match multiple times
-                player_ids = []
-                for slot in set_data["slots"]:
-                    if slot["entrant"]:
-                        player_ids.append(slot["entrant"]["id"])
+            winner_id = set_data.get("winnerId")
+            if is_complete_state(set_data["state"]) and winner_id:
+                # Read both entrants (id, name) in a single pass over the slots
+                entrants = [
+                    (
+                        slot["entrant"]["id"],
+                        slot["entrant"]["participants"][0]["gamerTag"],
+                    )
+                    for slot in set_data["slots"]
+                    if slot["entrant"]
+                ]
+
+                if len(entrants) == 2:
+                    (id_a, name_a), (id_b, name_b) = entrants
 
-                if len(player_ids) == 2:
-                    match_key = tuple(sorted(player_ids))
+                    # Create a unique match key to avoid counting the same match multiple times
+                    match_key = (id_a, id_b) if id_a <= id_b else (id_b, id_a)
 
                     # Skip if we've already processed this match
                     if match_key in match_count:
                         continue
                     match_count[match_key] = 1
 
+                    if id_a == winner_id:
+                        winner_name = name_a
+                    elif id_b == winner_id:
+                        winner_name = name_b
+                    else:
+                        winner_name = None
+
                     # Process the match
-                    for slot in set_data["slots"]:
-                        if slot["entrant"]:
-                            player_name = slot["entrant"]["participants"][0]["gamerTag"]
-                            player_id = slot["entrant"]["id"]
-
-                            if player_name not in bracket_results:
-                                bracket_results[player_name] = {
-                                    "wins": 0,
-                                    "losses": 0,
-                                    "final_round": 0,
-                                    "eliminated_by": None,
-                                }
+                    for player_id, player_name in entrants:
+                        player_results = bracket_results[player_name]
+
+                        if player_id == winner_id:
+                            player_results["wins"] += 1
+                            player_results["final_round"] = max(
+                                player_results["final_round"], set_data.get("round", 0)
+                            )
+                        else:
+                            player_results["losses"] += 1
+                            # Record who eliminated them
+                            if winner_name is not None:
+                                player_results["eliminated_by"] = winner_name
 
-                            if player_id == set_data["winnerId"]:
-                                bracket_results[player_name]["wins"] += 1
-                                bracket_results[player_name]["final_round"] = max(
-                                    bracket_results[player_name]["final_round"],
-                                    set_data.get("round", 0),
-                                )
-                            else:
-                                bracket_results[player_name]["losses"] += 1
-                                # Find who eliminated them
-                                for other_slot in set_data["slots"]:
-                                    if (
-                                        other_slot["entrant"]
-                                        and other_slot["entrant"]["id"]
-                                        == set_data["winnerId"]
-                                    ):
-                                        bracket_results[player_name][
-                                            "eliminated_by"
-                                        ] = other_slot["entrant"]["participants"][0][
-                                            "gamerTag"
-                                        ]
-                                        break
-
-    return bracket_results
+    return dict(bracket_results)
 
 
 def calculate_swiss_only_tournament_standings(initial_seeding, match_results):
@@ -1282,29 +1523,22 @@ def calculate_swiss_only_tournament_standings(initial_seeding, match_results):
 
     # Get Swiss-only match results (rounds 1-5 ONLY)
     swiss_match_results = [m for m in match_results if m["round"] <= 5]
-    swiss_standings = calculate_standings(initial_seeding, swiss_match_results)
 
-    # Calculate points-based standings
+    # Calculate points-based standings (these already carry each player's
+    # Swiss record and seed, so the standings are not recomputed here)
     final_standings_points = calculate_final_standings_points_based(
         initial_seeding, swiss_match_results
     )
 
     # Build final standings list
-    final_standings = []
-
-    for rank, player_data in enumerate(final_standings_points, 1):
-        player_name = player_data["name"]
-        swiss_data = swiss_standings.get(
-            player_name, {"wins": 0, "losses": 0, "seed": 999}
-        )
-
-        player_info = {
-            "name": player_name,
-            "initial_seed": swiss_data["seed"],
-            "swiss_wins": swiss_data["wins"],
-            "swiss_losses": swiss_data["losses"],
-            "total_wins": swiss_data["wins"],
-            "total_losses": swiss_data["losses"],
+    final_standings = [
+        {
+            "name": player_data["name"],
+            "initial_seed": player_data["initial_seed"],
+            "swiss_wins": player_data["wins"],
+            "swiss_losses": player_data["losses"],
+            "total_wins": player_data["wins"],
+            "total_losses": player_data["losses"],
             "final_placement": rank,
             "total_score": player_data["total_score"],
             "base_points": player_data["base_points"],
@@ -1314,14 +1548,14 @@ def calculate_swiss_only_tournament_standings(initial_seeding, match_results):
             "expected_wins": player_data["expected_wins"],
             "wins_above_expected": player_data["wins_above_expected"],
         }
-
-        final_standings.append(player_info)
+        for rank, player_data in enumerate(final_standings_points, 1)
+    ]
 
     # Display final standings with detailed breakdown
-    print(
-        f"\n{'Rank':<5} {'Player':<15} {'Record':<8} {'Seed':<6} {'Score':<8} {'Breakdown'}"
-    )
-    print("-" * 80)
+    lines = [
+        f"\n{'Rank':<5} {'Player':<15} {'Record':<8} {'Seed':<6} {'Score':<8} {'Breakdown'}",
+        "-" * 80,
+    ]
 
     for player in final_standings:
         record = f"{player['swiss_wins']}-{player['swiss_losses']}"
@@ -1341,14 +1575,14 @@ def calculate_swiss_only_tournament_standings(initial_seeding, match_results):
 
         breakdown = " | ".join(breakdown_parts)
 
-        print(
+        lines.append(
             f"{player['final_placement']:<5} {player['name']:<15} {record:<8} "
             f"#{player['initial_seed']:<5} {player['total_score']:<8.0f} {breakdown}"
         )
 
     # Show record groups summary
-    print(f"\n{'RECORD GROUPS SUMMARY'}")
-    print("-" * 40)
+    lines.append(f"\n{'RECORD GROUPS SUMMARY'}")
+    lines.append("-" * 40)
 
     record_groups = defaultdict(list)
     for player in final_standings:
@@ -1357,7 +1591,7 @@ def calculate_swiss_only_tournament_standings(initial_seeding, match_results):
 
     for record in sorted(record_groups.keys(), key=lambda x: (-x[0], x[1])):
         players_in_group = record_groups[record]
-        print(f"\n{record[0]}-{record[1]}: {len(players_in_group)} players")
+        lines.append(f"\n{record[0]}-{record[1]}: {len(players_in_group)} players")
 
         # Show top performers in each group
         for player in players_in_group[:3]:  # Show top 3 in each group
@@ -1372,13 +1606,15 @@ def calculate_swiss_only_tournament_standings(initial_seeding, match_results):
             else:
                 perf_indicator = " (performing as expected)"
 
-            print(
+            lines.append(
                 f"  #{player['final_placement']:2d}. {player['name']} "
                 f"(seed #{player['initial_seed']}){perf_indicator}"
             )
 
         if len(players_in_group) > 3:
-            print(f"  ... and {len(players_in_group) - 3} more")
+            lines.append(f"  ... and {len(players_in_group) - 3} more")
+
+    print("\n".join(lines))
 
     return final_standings
 
@@ -1402,11 +1638,11 @@ def update_final_standings_phase(phases, final_tournament_standings, initial_see
 
     # Get current state query
     CURRENT_STATE_QUERY = """
-    query GetCurrentState($phaseId: ID!) {
+    query GetCurrentState($phaseId: ID!, $perPage: Int!) {
         phase(id: $phaseId) {
             phaseGroups {
                 nodes {
-                    seeds(query: {perPage: 100}) {
+                    seeds(query: {perPage: $perPage}) {
                         nodes {
                             id
                             seedNum
@@ -1423,17 +1659,50 @@ def update_final_standings_phase(phases, final_tournament_standings, initial_see
     }
     """
 
-    SWAP_MUTATION = """
-    mutation SwapSeeds($phaseId: ID!, $seed1Id: ID!, $seed2Id: ID!) {
-        swapSeeds(phaseId: $phaseId, seed1Id: $seed1Id, seed2Id: $seed2Id) {
-            id
+    # Verification only needs positions - names come from the initial fetch
+    CURRENT_SEED_NUMS_QUERY = """
+    query GetCurrentSeedNums($phaseId: ID!, $perPage: Int!) {
+        phase(id: $phaseId) {
+            phaseGroups {
+                nodes {
+                    seeds(query: {perPage: $perPage}) {
+                        nodes {
+                            id
+                            seedNum
+                        }
+                    }
+                }
+            }
         }
     }
     """
 
-    def get_current_positions():
+    # Swaps are sent several per request as aliased swapSeeds fields, which
+    # GraphQL executes one after another in the order written
+    SWAP_BATCH_SIZE = 10
+
+    def build_swap_mutation(batch_size):
+        """Build a mutation with batch_size aliased swapSeeds fields"""
+        params = "".join(
+            f", $seed1Id{k}: ID!, $seed2Id{k}: ID!" for k in range(batch_size)
+        )
+        fields = "".join(
+            f"""
+        swap{k}: swapSeeds(phaseId: $phaseId, seed1Id: $seed1Id{k}, seed2Id: $seed2Id{k}) {{
+            id
+        }}"""
+            for k in range(batch_size)
+        )
+        return f"""
+    mutation SwapSeeds($phaseId: ID!{params}) {{{fields}
+    }}
+    """
+
+    def get_current_positions(query, per_page, name_by_seed_id=None):
+        """Fetch seeds as two flat lists indexed by position (seedNum - 1)"""
         current_data = make_request(
-            CURRENT_STATE_QUERY, {"phaseId": final_standings_phase["id"]}
+            query,
+            {"phaseId": final_standings_phase["id"], "perPage": per_page},
         )
         if not (current_data and "data" in current_data):
             return None
@@ -1441,100 +1710,171 @@ def update_final_standings_phase(phases, final_tournament_standings, initial_see
         seeds = current_data["data"]["phase"]["phaseGroups"]["nodes"][0]["seeds"][
             "nodes"
         ]
-        position_to_player = {}
-        player_to_seed = {}
+        num_positions = max(
+            [seed["seedNum"] for seed in seeds] + [len(final_tournament_standings)]
+        )
+        players_by_position = [None] * num_positions
+        seed_ids_by_position = [None] * num_positions
 
         for seed in seeds:
-            if seed["entrant"] and seed["entrant"]["participants"]:
-                gamer_tag = seed["entrant"]["participants"][0]["gamerTag"]
-                position = seed["seedNum"]
-                seed_id = seed["id"]
+            if name_by_seed_id is not None:
+                name = name_by_seed_id.get(seed["id"])
+            elif seed["entrant"] and seed["entrant"]["participants"]:
+                name = seed["entrant"]["participants"][0]["gamerTag"]
+            else:
+                name = None
 
-                position_to_player[position] = gamer_tag
-                player_to_seed[gamer_tag] = {"position": position, "seed_id": seed_id}
+            if name is not None:
+                index = seed["seedNum"] - 1
+                players_by_position[index] = name
+                seed_ids_by_position[index] = seed["id"]
 
-        return position_to_player, player_to_seed
+        return players_by_position, seed_ids_by_position
 
-    # Get initial state
-    position_to_player, player_to_seed = get_current_positions()
-    if not position_to_player:
+    # Get initial state (fetched once - swaps are mirrored locally below).
+    # The phase can hold more entrants than the standings and players can be
+    # seeded anywhere in it, so fetch the whole phase, not just N seeds
+    current_positions = get_current_positions(
+        CURRENT_STATE_QUERY, max(100, len(final_tournament_standings))
+    )
+    if not current_positions:
         print("❌ Could not get current positions")
         return False
+    players_by_position, seed_ids_by_position = current_positions
+    index_by_player = {
+        name: index
+        for index, name in enumerate(players_by_position)
+        if name is not None
+    }
+    name_by_seed_id = {
+        seed_id: name
+        for name, seed_id in zip(players_by_position, seed_ids_by_position)
+        if name is not None
+    }
+
+    missing_players = [
+        player["name"]
+        for player in final_tournament_standings
+        if player["name"] not in index_by_player
+    ]
+    if missing_players:
+        print(f"❌ Players not found in phase: {', '.join(missing_players)}")
+        return False
 
     print(f"\nTarget final standings (top 10):")
     for i, player_data in enumerate(final_tournament_standings[:10], 1):
         print(f"  Position {i}: {player_data['name']}")
 
-    # Execute swaps
-    print(f"\nExecuting swaps to achieve final standings...")
-    swap_count = 0
-    max_swaps = 100
-
-    while swap_count < max_swaps:
-        position_to_player, player_to_seed = get_current_positions()
-        swap_needed = False
+    # Plan swaps locally: walk the target positions in order and bring each
+    # target player into place. Positions before the current one are already
+    # final, so each swap fixes one position for good and the plan follows
+    # the permutation's cycles - n minus the number of cycles swaps in total
+    planned_swaps = []
+    for target_index, target_player in enumerate(final_tournament_standings):
+        current_player_at_pos = players_by_position[target_index]
+        target_player_name = target_player["name"]
 
-        for target_pos, target_player in enumerate(final_tournament_standings, 1):
-            current_player_at_pos = position_to_player.get(target_pos)
-            target_player_name = target_player["name"]
+        if current_player_at_pos == target_player_name:
+            continue
 
-            if current_player_at_pos != target_player_name:
-                current_pos_of_target = player_to_seed[target_player_name]["position"]
+        if current_player_at_pos is None:
+            print(f"    ❌ No seed at position {target_index + 1} to swap with")
+            return False
+
+        current_index_of_target = index_by_player[target_player_name]
+        planned_swaps.append(
+            (
+                target_player_name,
+                current_index_of_target,
+                current_player_at_pos,
+                target_index,
+                seed_ids_by_position[current_index_of_target],
+                seed_ids_by_position[target_index],
+            )
+        )
 
-                if current_pos_of_target != target_pos:
-                    player1_seed_id = player_to_seed[target_player_name]["seed_id"]
-                    player2_seed_id = player_to_seed[current_player_at_pos]["seed_id"]
+        # Mirror the swap locally instead of re-fetching the phase
+        i, j = target_index, current_index_of_target
+        players_by_position[i], players_by_position[j] = (
+            players_by_position[j],
+            players_by_position[i],
+        )
+        seed_ids_by_position[i], seed_ids_by_position[j] = (
+            seed_ids_by_position[j],
+            seed_ids_by_position[i],
+        )
+        index_by_player[target_player_name] = i
+        index_by_player[current_player_at_pos] = j
 
-                    print(
-                        f"  Swap {swap_count + 1}: {target_player_name} (pos {current_pos_of_target}) ↔ {current_player_at_pos} (pos {target_pos})"
-                    )
+    # Execute swaps
+    print(f"\nExecuting swaps to achieve final standings...")
+    swap_count = 0
 
-                    result = make_request(
-                        SWAP_MUTATION,
-                        {
-                            "phaseId": final_standings_phase["id"],
-                            "seed1Id": player1_seed_id,
-                            "seed2Id": player2_seed_id,
-                        },
-                        is_mutation=True,
-                    )
+    for start in range(0, len(planned_swaps), SWAP_BATCH_SIZE):
+        batch = planned_swaps[start : start + SWAP_BATCH_SIZE]
+        variables = {"phaseId": final_standings_phase["id"]}
+
+        for k, (
+            target_player_name,
+            current_index_of_target,
+            current_player_at_pos,
+            target_index,
+            seed1_id,
+            seed2_id,
+        ) in enumerate(batch):
+            print(
+                f"  Swap {swap_count + k + 1}: {target_player_name} (pos {current_index_of_target + 1}) ↔ {current_player_at_pos} (pos {target_index + 1})"
+            )
+            variables[f"seed1Id{k}"] = seed1_id
+            variables[f"seed2Id{k}"] = seed2_id
 
-                    if result and "data" in result and result["data"]["swapSeeds"]:
-                        swap_count += 1
-                        swap_needed = True
-                        break
-                    else:
-                        print(f"    ❌ Swap failed")
-                        return False
+        result = make_request(
+            build_swap_mutation(len(batch)), variables, is_mutation=True
+        )
 
-        if not swap_needed:
-            print("✅ All players in correct positions!")
-            break
+        # swapSeeds is its own inverse, so a failed batch is not re-sent -
+        # re-running the command re-plans from the phase's actual state
+        data = result.get("data") if result else None
+        failed_swaps = [
+            swap_count + k + 1
+            for k in range(len(batch))
+            if not (data and data.get(f"swap{k}"))
+        ]
+        if failed_swaps:
+            print(f"    ❌ Swap failed: {', '.join(map(str, failed_swaps))}")
+            if result and "errors" in result:
+                print(f"    Errors: {result['errors']}")
+            return False
 
-    if swap_count >= max_swaps:
-        print(f"⚠️  Reached maximum swap limit ({max_swaps})")
-        return False
+        swap_count += len(batch)
 
-    # Verify final result
+    # Verify final result with a single fresh query
     print(f"\n🔍 Verification after {swap_count} swaps:")
-    position_to_player, player_to_seed = get_current_positions()
+    current_positions = get_current_positions(
+        CURRENT_SEED_NUMS_QUERY, len(final_tournament_standings), name_by_seed_id
+    )
+    if not current_positions:
+        print("❌ Could not get current positions for verification")
+        return False
+    players_by_position, _ = current_positions
 
-    all_correct = True
     for target_pos, player_data in enumerate(final_tournament_standings[:10], 1):
-        current_player = position_to_player.get(target_pos, "NOT FOUND")
+        current_player = players_by_position[target_pos - 1] or "NOT FOUND"
         expected_player = player_data["name"]
-
-        if current_player == expected_player:
-            status = "✅"
-        else:
-            status = "❌"
-            all_correct = False
+        status = "✅" if current_player == expected_player else "❌"
 
         print(
             f"  {status} Position {target_pos}: expected {expected_player}, got {current_player}"
         )
 
+    # Only the fetched state can confirm every position, not the local plan
+    all_correct = all(
+        players_by_position[index] == player_data["name"]
+        for index, player_data in enumerate(final_tournament_standings)
+    )
+
     if all_correct:
+        print("✅ All players in correct positions!")
         print(
             f"\n🎉 SUCCESS! Final standings correctly arranged using {swap_count} swaps!"
         )
@@ -1544,8 +1884,25 @@ def update_final_standings_phase(phases, final_tournament_standings, initial_see
         return False
 
 
-def analyze_player_pairings(player_name, initial_seeding, detailed_phases):
-    """Analyze why a specific player was paired with their opponents"""
+class PlayerMatch(NamedTuple):
+    """A completed match from one player's point of view"""
+
+    opponent: str
+    won: bool
+    opponent_seed: int
+    phase: str
+    round: int  # Swiss round, or bracket set round (negative for losers side)
+
+
+def analyze_player_pairings(
+    player_name, initial_seeding, detailed_phases, swiss_match_results=None
+):
+    """Analyze why a specific player was paired with their opponents
+
+    swiss_match_results can be passed in (from get_match_results_from_phases
+    with swiss_only=True) to avoid re-walking the phases when analyzing
+    several players.
+    """
     print(f"\n{'='*60}")
     print(f"PAIRING ANALYSIS FOR: {player_name}")
     print(f"{'='*60}")
@@ -1567,14 +1924,10 @@ def analyze_player_pairings(player_name, initial_seeding, detailed_phases):
         if get_phase_state(phase["state"]) != 3:  # Only completed phases
             continue
 
-        phase_name = phase["name"].lower()
-        is_swiss = "round" in phase_name and any(
-            str(i) in phase_name for i in range(1, 6)
-        )
-        is_bracket = "bracket" in phase_name
-
-        if not (is_swiss or is_bracket):
+        phase_type = get_phase_type(phase)
+        if phase_type is None:
             continue
+        is_swiss = phase_type == "swiss"
 
         # Extract round number for Swiss
         round_num = extract_round_number(phase["name"]) if is_swiss else None
@@ -1582,55 +1935,52 @@ def analyze_player_pairings(player_name, initial_seeding, detailed_phases):
         # Get matches from this phase
         for group in phase["phaseGroups"]["nodes"]:
             for set_data in group["sets"]["nodes"]:
-                if get_phase_state(set_data["state"]) == 3 and set_data["winnerId"]:
-                    # Check if player is in this match
+                winner_id = set_data["winnerId"]
+                if is_complete_state(set_data["state"]) and winner_id:
+                    # Check if player is in this match and find the opponent
+                    # in the same pass over the slots
                     player_in_match = False
                     opponent = None
                     won = False
 
                     for slot in set_data["slots"]:
-                        if slot["entrant"] and slot["entrant"]["participants"]:
-                            name = slot["entrant"]["participants"][0]["gamerTag"]
+                        entrant = slot["entrant"]
+                        if entrant and entrant["participants"]:
+                            name = entrant["participants"][0]["gamerTag"]
                             if name == player_name:
                                 player_in_match = True
-                                won = slot["entrant"]["id"] == set_data["winnerId"]
-
-                    if player_in_match:
-                        # Find opponent
-                        for slot in set_data["slots"]:
-                            if slot["entrant"] and slot["entrant"]["participants"]:
-                                name = slot["entrant"]["participants"][0]["gamerTag"]
-                                if name != player_name:
-                                    opponent = name
-                                    break
-
-                        if opponent:
-                            match_info = {
-                                "opponent": opponent,
-                                "won": won,
-                                "opponent_seed": initial_seeding.get(opponent, 0),
-                                "phase": phase["name"],
-                            }
+                                won = entrant["id"] == winner_id
+                            elif opponent is None:
+                                opponent = name
+
+                    if player_in_match and opponent:
+                        match_info = PlayerMatch(
+                            opponent=opponent,
+                            won=won,
+                            opponent_seed=initial_seeding.get(opponent, 0),
+                            phase=phase["name"],
+                            round=round_num if is_swiss else set_data.get("round", 0),
+                        )
 
-                            if is_swiss:
-                                match_info["round"] = round_num
-                                swiss_matches.append(match_info)
-                            else:
-                                match_info["bracket_round"] = set_data.get("round", 0)
-                                bracket_matches.append(match_info)
+                        if is_swiss:
+                            swiss_matches.append(match_info)
+                        else:
+                            bracket_matches.append(match_info)
 
     # Sort Swiss matches by round
-    swiss_matches.sort(key=lambda x: x["round"])
+    swiss_matches.sort(key=lambda x: x.round)
 
     # Display Swiss match history
-    print(f"\n{'SWISS ROUNDS (1-5)'}")
-    print(f"{'Round':<8} {'Opponent':<20} {'Seed':<6} {'Result':<8} {'Record'}")
-    print("-" * 60)
+    lines = [
+        f"\n{'SWISS ROUNDS (1-5)'}",
+        f"{'Round':<8} {'Opponent':<20} {'Seed':<6} {'Result':<8} {'Record'}",
+        "-" * 60,
+    ]
 
     swiss_wins = 0
     swiss_losses = 0
     for match in swiss_matches:
-        if match["won"]:
+        if match.won:
             swiss_wins += 1
             result = "WIN ✓"
         else:
@@ -1638,129 +1988,132 @@ def analyze_player_pairings(player_name, initial_seeding, detailed_phases):
             result = "LOSS ✗"
 
         record = f"{swiss_wins}-{swiss_losses}"
-        print(
-            f"Round {match['round']:<2} {match['opponent']:<20} "
-            f"#{match['opponent_seed']:<4} {result:<8} {record}"
+        lines.append(
+            f"Round {match.round:<2} {match.opponent:<20} "
+            f"#{match.opponent_seed:<4} {result:<8} {record}"
         )
 
     final_swiss_record = f"{swiss_wins}-{swiss_losses}"
 
     # Bracket seeding calculation
-    print(f"\n{'BRACKET SEEDING CALCULATION'}")
-    print("=" * 60)
-
-    # Get ONLY Swiss results (rounds 1-5)
-    swiss_match_results = get_match_results_from_phases(
-        detailed_phases, swiss_only=True
-    )
-    swiss_only_results = [m for m in swiss_match_results if m["round"] <= 5]
+    lines.append(f"\n{'BRACKET SEEDING CALCULATION'}")
+    lines.append("=" * 60)
+
+    # Get ONLY Swiss results (rounds 1-5) - swiss_only=True already drops
+    # every round past 5, so the results are used as-is
+    if swiss_match_results is None:
+        swiss_match_results = get_match_results_from_phases(
+            detailed_phases, swiss_only=True
+        )
 
     final_standings = calculate_final_standings_points_based(
-        initial_seeding, swiss_only_results
+        initial_seeding, swiss_match_results
     )
 
-    # Find player's position
-    player_standing = next(
-        (p for p in final_standings if p["name"] == player_name), None
+    # Find player's position (and overall rank in the same scan)
+    overall_rank, player_standing = next(
+        (
+            (rank, p)
+            for rank, p in enumerate(final_standings, 1)
+            if p["name"] == player_name
+        ),
+        (None, None),
     )
 
     if player_standing:
-        print(f"\nPOINTS BREAKDOWN:")
-        print("─" * 40)
+        lines.append(f"\nPOINTS BREAKDOWN:")
+        lines.append("─" * 40)
 
         # Base points
-        print(
+        lines.append(
             f"Base Points (seed #{player_seed}): {player_standing['base_points']:.1f}"
         )
 
         # Win quality
-        print(f"Win Quality: +{player_standing['win_points']:.1f}")
+        lines.append(f"Win Quality: +{player_standing['win_points']:.1f}")
 
         # Loss quality
-        print(f"Loss Quality: {player_standing['loss_points']:.1f}")
+        lines.append(f"Loss Quality: {player_standing['loss_points']:.1f}")
 
         # Cinderella bonus calculation with details
         expected_wins = get_expected_wins(player_seed)
         actual_wins_above = swiss_wins - expected_wins
 
-        print(f"\nCINDERELLA BONUS CALCULATION:")
-        print(f"  Expected wins for seed #{player_seed}: {expected_wins:.1f}")
-        print(f"  Actual Swiss wins: {swiss_wins}")
-        print(f"  Overperformance: {actual_wins_above:.1f} wins")
+        lines.append(f"\nCINDERELLA BONUS CALCULATION:")
+        lines.append(f"  Expected wins for seed #{player_seed}: {expected_wins:.1f}")
+        lines.append(f"  Actual Swiss wins: {swiss_wins}")
+        lines.append(f"  Overperformance: {actual_wins_above:.1f} wins")
 
         if actual_wins_above > 0.5:
             multiplier, desc = get_cinderella_multiplier(player_seed)
-            print(f"  Multiplier: {multiplier}x ({desc})")
+            lines.append(f"  Multiplier: {multiplier}x ({desc})")
 
             # Show any major upsets
             upset_count = 0
             for match in swiss_matches:
-                if match["won"]:
-                    seed_diff = player_seed - match["opponent_seed"]
-                    if seed_diff >= 16:
-                        print(
-                            f"  🌟 HUGE upset vs {match['opponent']} (#{match['opponent_seed']})"
-                        )
-                        upset_count += 1
-                    elif seed_diff >= 12:
-                        print(
-                            f"  ⭐ Big upset vs {match['opponent']} (#{match['opponent_seed']})"
-                        )
-                        upset_count += 1
-                    elif seed_diff >= 8:
-                        print(
-                            f"  ✨ Upset vs {match['opponent']} (#{match['opponent_seed']})"
+                if match.won:
+                    tier = bisect_right(
+                        UPSET_SEED_GAPS, player_seed - match.opponent_seed
+                    )
+                    if tier:
+                        lines.append(
+                            f"  {UPSET_LABELS[tier]} vs {match.opponent} "
+                            f"(#{match.opponent_seed})"
                         )
                         upset_count += 1
 
-            print(
+            lines.append(
                 f"  Total Cinderella Bonus: +{player_standing['cinderella_bonus']:.1f}"
             )
         else:
-            print(f"  No Cinderella bonus (need >0.5 wins above expected)")
+            lines.append(f"  No Cinderella bonus (need >0.5 wins above expected)")
 
         # Win points
-        print(f"\nWin Points: {swiss_wins} × 100 = {swiss_wins * 100}")
+        lines.append(f"\nWin Points: {swiss_wins} × 100 = {swiss_wins * 100}")
 
         # Total
-        print(f"\n{'─' * 40}")
-        print(f"TOTAL SCORE: {player_standing['total_score']:.1f}")
+        lines.append(f"\n{'─' * 40}")
+        lines.append(f"TOTAL SCORE: {player_standing['total_score']:.1f}")
 
-        overall_rank = final_standings.index(player_standing) + 1
-        print(f"\nFinal Swiss Rank: #{overall_rank} of {len(final_standings)}")
+        lines.append(f"\nFinal Swiss Rank: #{overall_rank} of {len(final_standings)}")
 
         if overall_rank <= 16:
-            print("→ MAIN BRACKET (Top 16)")
+            lines.append("→ MAIN BRACKET (Top 16)")
             bracket_seed = overall_rank
         else:
-            print("→ REDEMPTION BRACKET (Bottom 16)")
+            lines.append("→ REDEMPTION BRACKET (Bottom 16)")
             bracket_seed = overall_rank - 16
 
-        print(f"→ Bracket seed: #{bracket_seed}")
+        lines.append(f"→ Bracket seed: #{bracket_seed}")
 
     # Display bracket matches if any
     if bracket_matches:
-        print(f"\n{'BRACKET MATCHES'}")
-        print("=" * 60)
+        lines.append(f"\n{'BRACKET MATCHES'}")
+        lines.append("=" * 60)
 
         # Determine which bracket
         bracket_type = "Unknown"
         for match in bracket_matches:
-            if "main" in match["phase"].lower():
+            phase = match.phase.lower()
+            if "main" in phase:
                 bracket_type = "Main Bracket"
                 break
-            elif "redemption" in match["phase"].lower():
+            elif "redemption" in phase:
                 bracket_type = "Redemption Bracket"
                 break
 
-        print(f"{bracket_type}:")
-        print(f"{'Round':<8} {'Opponent':<20} {'Seed':<6} {'Result'}")
-        print("-" * 50)
+        lines.extend(
+            [
+                f"{bracket_type}:",
+                f"{'Round':<8} {'Opponent':<20} {'Seed':<6} {'Result'}",
+                "-" * 50,
+            ]
+        )
 
         for match in bracket_matches:
-            result = "WIN ✓" if match["won"] else "LOSS ✗"
+            result = "WIN ✓" if match.won else "LOSS ✗"
             # Handle negative rounds for losers bracket
-            bracket_round = match["bracket_round"]
+            bracket_round = match.round
             if bracket_round < 0:
                 round_text = f"L{abs(bracket_round)}"
             elif bracket_round > 0:
@@ -1768,11 +2121,157 @@ def analyze_player_pairings(player_name, initial_seeding, detailed_phases):
             else:
                 round_text = "?"
 
-            print(
-                f"{round_text:<8} {match['opponent']:<20} "
-                f"#{match['opponent_seed']:<4} {result}"
+            lines.append(
+                f"{round_text:<8} {match.opponent:<20} "
+                f"#{match.opponent_seed:<4} {result}"
             )
 
+    print("\n".join(lines))
+
+
+def run_bracket_command(slug, command, initial_seeding, detailed_phases):
+    """Generate main/redemption bracket seeding from the Swiss results"""
+    match_results = get_match_results_from_phases(detailed_phases, swiss_only=True)
+
+    print("Generating bracket seeding...")
+    final_standings = calculate_final_standings_points_based(
+        initial_seeding, match_results
+    )
+    generate_bracket_seeding(final_standings)
+
+
+def run_standings_command(slug, command, initial_seeding, detailed_phases):
+    """Calculate final standings and push them to the Final Standings phase"""
+    match_results = get_match_results_from_phases(detailed_phases, swiss_only=True)
+    print("Calculating final tournament standings...")
+
+    # Use Swiss-only standings calculation
+    final_tournament_standings = calculate_swiss_only_tournament_standings(
+        initial_seeding, match_results
+    )
+
+    if final_tournament_standings:
+        print("\nUpdating 'Final Standings' phase...")
+        success = update_final_standings_phase(
+            detailed_phases, final_tournament_standings, initial_seeding
+        )
+        if success:
+            print("\n🎉 Final standings calculated and phase updated successfully!")
+        else:
+            print("\n⚠️  Final standings calculated but phase update failed")
+
+
+def run_why_command(slug, command, initial_seeding, detailed_phases):
+    """Explain a single player's pairings and standings"""
+    if len(sys.argv) < 4:
+        print("Usage: python daness-v2.py <event-slug> why <player-name>")
+        sys.exit(1)
+
+    player_name = " ".join(sys.argv[3:])  # Handle names with spaces
+    print(f"Analyzing pairings for: {player_name}")
+
+    # Analyze the player
+    analyze_player_pairings(player_name, initial_seeding, detailed_phases)
+
+
+def run_round_command(slug, command, initial_seeding, detailed_phases):
+    """Calculate and upload pairings for the given (or next unstarted) round"""
+    # Handle round-specific updates
+    target_round = None
+    if command and command.isdigit():
+        target_round = int(command)
+        print(f"Target round specified: {target_round}")
+    else:
+        print("Finding next unstarted phase...")
+        # Find next unstarted phase
+        for phase in detailed_phases:
+            phase_state = get_phase_state(phase["state"])
+            if phase_state < 2:  # NOT_STARTED or CREATED
+                target_round = extract_round_number(phase["name"])
+                print(f"Found unstarted phase: {phase['name']}, round {target_round}")
+                break
+
+        if target_round is None:
+            print("All phases are started or completed")
+            sys.exit(1)
+
+    # Find the phase for target round
+    target_phase = None
+    for phase in detailed_phases:
+        if extract_round_number(phase["name"]) == target_round:
+            target_phase = phase
+            print(f"Found target phase: {phase['name']}")
+            break
+
+    if not target_phase:
+        print(f"Round {target_round} phase not found")
+        sys.exit(1)
+
+    target_phase_state = get_phase_state(target_phase["state"])
+    if target_phase_state >= 2:
+        print(f"Round {target_round} has already started")
+        sys.exit(1)
+
+    print(f"\nPreparing pairings for Round {target_round}")
+
+    # Calculate standings
+    print("Calculating standings...")
+    match_results = get_match_results_from_phases(detailed_phases, swiss_only=True)
+    standings = calculate_standings(initial_seeding, match_results)
+    print(f"Calculated standings for {len(standings)} players")
+
+    # Calculate pairings
+    print("Calculating pairings...")
+    pairings = calculate_swiss_pairings(standings, round_number=target_round)
+
+    lines = [f"\nCalculated {len(pairings)} pairings:"]
+    lines.extend(
+        f"  Match {i}: {p1_name} ({p1_info['wins']}-{p1_info['losses']}) vs "
+        f"{p2_name} ({p2_info['wins']}-{p2_info['losses']})"
+        for i, ((p1_name, p1_info), (p2_name, p2_info)) in enumerate(pairings, 1)
+    )
+    print("\n".join(lines))
+
+    # Update the phase seeding
+    print("Updating phase seeding...")
+    if update_phase_seeding_for_pairings(
+        target_phase["id"], target_phase["phaseGroups"]["nodes"], pairings
+    ):
+        print(f"\n✅ Successfully updated Round {target_round} pairings!")
+        print("You can now start this phase in StartGG.")
+    else:
+        print(f"\n❌ Failed to update Round {target_round} pairings")
+        return
+
+    # Recommend stream matches
+    print("Generating stream recommendations...")
+    recommend_stream_matches(pairings, standings)
+
+
+def phase_details_needed(command, phase):
+    """Whether a command reads the detailed seeds/sets of a phase"""
+    phase_state = get_phase_state(phase["state"])
+    phase_type = get_phase_type(phase)
+
+    if command == "bracket":
+        return phase_type == "swiss" and phase_state == 3
+    if command == "why":
+        return phase_type is not None and phase_state == 3
+    if command == "standings":
+        is_final_standings = phase["name"].lower() == "final standings"
+        return is_final_standings or (phase_type == "swiss" and phase_state == 3)
+
+    # Round updates read Swiss results plus the seeds of the unstarted target
+    return phase_type == "swiss" or phase_state < 2
+
+
+# Named subcommands; anything else (a round number or nothing) updates a round
+COMMANDS = {
+    "bracket": run_bracket_command,
+    "standings": run_standings_command,
+    "why": run_why_command,
+}
+
 
 def main():
     try:
@@ -1826,17 +2325,77 @@ def main():
             )
             print(f"  - {phase['name']} (state: {state_name})")
 
-        # Get detailed data for each phase
+        # Get detailed data for the phases this command reads (plus the first
+        # phase for initial seeding), reusing cached completed phases
+        phase_cache = load_phase_cache(slug)
+        cache_updated = False
+        needed_phases = [
+            phase
+            for index, phase in enumerate(phases)
+            if index == 0 or phase_details_needed(command, phase)
+        ]
+        skipped_count = len(phases) - len(needed_phases)
+
+        # Seeds are read from the first phase (initial seeding) and from
+        # unstarted phases (round update targets)
+        seeds_phase_ids = {
+            phase["id"]
+            for index, phase in enumerate(needed_phases)
+            if index == 0 or get_phase_state(phase["state"]) < 2
+        }
+
+        def is_cached(phase):
+            cached_phase = phase_cache.get(str(phase["id"]))
+            return (
+                cached_phase is not None
+                and get_phase_state(phase["state"]) == 3
+                and cached_phase["state"] == phase["state"]
+                and (
+                    phase["id"] not in seeds_phase_ids
+                    or all(
+                        "seeds" in group
+                        for group in cached_phase["phaseGroups"]["nodes"]
+                    )
+                )
+            )
+
+        fetched_phases = fetch_phase_details(
+            [phase["id"] for phase in needed_phases if not is_cached(phase)],
+            seeds_phase_ids,
+        )
+
         detailed_phases = []
-        for phase in phases:
-            phase_data = make_request(PHASE_DETAILS_QUERY, {"phaseId": phase["id"]})
-            if phase_data and "data" in phase_data and phase_data["data"]["phase"]:
-                detailed_phase = phase_data["data"]["phase"]
-                detailed_phase["state"] = phase["state"]
-                detailed_phase["phaseOrder"] = phase["phaseOrder"]
-                detailed_phases.append(detailed_phase)
+        cached_count = 0
+        for phase in needed_phases:
+            if is_cached(phase):
+                # Work on a copy so the cache keeps only the API response and
+                # the state it is keyed on (older files also saved phaseType)
+                detailed_phase = dict(phase_cache[str(phase["id"])])
+                detailed_phase.pop("phaseType", None)
+                cached_count += 1
+            else:
+                detailed_phase = fetched_phases.get(phase["id"])
+                if not detailed_phase:
+                    continue
+                if get_phase_state(phase["state"]) == 3:
+                    phase_cache[str(phase["id"])] = {
+                        **detailed_phase,
+                        "state": phase["state"],
+                    }
+                    cache_updated = True
+
+            detailed_phase["state"] = phase["state"]
+            detailed_phase["phaseOrder"] = phase["phaseOrder"]
+            get_phase_type(detailed_phase)  # Classify once at load time
+            detailed_phases.append(detailed_phase)
 
-        print(f"Got detailed data for {len(detailed_phases)} phases")
+        print(
+            f"Got detailed data for {len(detailed_phases)} phases "
+            f"({cached_count} from cache, {skipped_count} not needed)"
+        )
+
+        if cache_updated:
+            save_phase_cache(slug, phase_cache)
 
         # Get initial seeding
         first_phase = detailed_phases[0]
@@ -1857,135 +2416,9 @@ def main():
         initial_seeding = load_initial_seeding(seeding_file)
         print(f"Loaded initial seeding for {len(initial_seeding)} players")
 
-        # Handle bracket generation command
-        if command == "bracket":
-            match_results = get_match_results_from_phases(
-                detailed_phases, swiss_only=True
-            )
-
-            print("Generating bracket seeding...")
-            final_standings = calculate_final_standings_points_based(
-                initial_seeding, match_results
-            )
-            generate_bracket_seeding(final_standings)
-            return
-
-        # Handle final standings command
-        if command == "standings":
-            match_results = get_match_results_from_phases(
-                detailed_phases, swiss_only=True
-            )
-            print("Calculating final tournament standings...")
-
-            # Use Swiss-only standings calculation
-            final_tournament_standings = calculate_swiss_only_tournament_standings(
-                initial_seeding, match_results
-            )
-
-            if final_tournament_standings:
-                print("\nUpdating 'Final Standings' phase...")
-                success = update_final_standings_phase(
-                    detailed_phases, final_tournament_standings, initial_seeding
-                )
-                if success:
-                    print(
-                        "\n🎉 Final standings calculated and phase updated successfully!"
-                    )
-                else:
-                    print("\n⚠️  Final standings calculated but phase update failed")
-            return
-
-        if command == "why":
-            if len(sys.argv) < 4:
-                print("Usage: python daness-v2.py <event-slug> why <player-name>")
-                sys.exit(1)
-
-            player_name = " ".join(sys.argv[3:])  # Handle names with spaces
-            print(f"Analyzing pairings for: {player_name}")
-
-            # Load initial seeding
-            seeding_file = f"{slug.replace('/', '-')}-seeding.txt"
-            if not os.path.exists(seeding_file):
-                print(f"❌ No seeding file found. Run the tool without commands first.")
-                sys.exit(1)
-
-            initial_seeding = load_initial_seeding(seeding_file)
-
-            # Analyze the player
-            analyze_player_pairings(player_name, initial_seeding, detailed_phases)
-            return
-
-        # Handle round-specific updates
-        target_round = None
-        if command and command.isdigit():
-            target_round = int(command)
-            print(f"Target round specified: {target_round}")
-        else:
-            print("Finding next unstarted phase...")
-            # Find next unstarted phase
-            for phase in detailed_phases:
-                phase_state = get_phase_state(phase["state"])
-                if phase_state < 2:  # NOT_STARTED or CREATED
-                    target_round = extract_round_number(phase["name"])
-                    print(
-                        f"Found unstarted phase: {phase['name']}, round {target_round}"
-                    )
-                    break
-
-            if target_round is None:
-                print("All phases are started or completed")
-                sys.exit(1)
-
-        # Find the phase for target round
-        target_phase = None
-        for phase in detailed_phases:
-            if extract_round_number(phase["name"]) == target_round:
-                target_phase = phase
-                print(f"Found target phase: {phase['name']}")
-                break
-
-        if not target_phase:
-            print(f"Round {target_round} phase not found")
-            sys.exit(1)
-
-        target_phase_state = get_phase_state(target_phase["state"])
-        if target_phase_state >= 2:
-            print(f"Round {target_round} has already started")
-            sys.exit(1)
-
-        print(f"\nPreparing pairings for Round {target_round}")
-
-        # Calculate standings
-        print("Calculating standings...")
-        match_results = get_match_results_from_phases(detailed_phases, swiss_only=True)
-        standings = calculate_standings(initial_seeding, match_results)
-        print(f"Calculated standings for {len(standings)} players")
-
-        # Calculate pairings
-        print("Calculating pairings...")
-        pairings = calculate_swiss_pairings(standings, round_number=target_round)
-
-        print(f"\nCalculated {len(pairings)} pairings:")
-        for i, ((p1_name, p1_info), (p2_name, p2_info)) in enumerate(pairings, 1):
-            print(
-                f"  Match {i}: {p1_name} ({p1_info['wins']}-{p1_info['losses']}) vs "
-                + f"{p2_name} ({p2_info['wins']}-{p2_info['losses']})"
-            )
-
-        # Update the phase seeding
-        print("Updating phase seeding...")
-        if update_phase_seeding_for_pairings(
-            target_phase["id"], target_phase["phaseGroups"]["nodes"], pairings
-        ):
-            print(f"\n✅ Successfully updated Round {target_round} pairings!")
-            print("You can now start this phase in StartGG.")
-        else:
-            print(f"\n❌ Failed to update Round {target_round} pairings")
-            return
-
-        # Recommend stream matches
-        print("Generating stream recommendations...")
-        recommend_stream_matches(pairings, standings)
+        # Dispatch to the requested command
+        handler = COMMANDS.get(command, run_round_command)
+        handler(slug, command, initial_seeding, detailed_phases)
 
     except Exception as e:
         print(f"Error occurred: {e}")
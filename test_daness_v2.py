@@ -7,7 +7,8 @@ This creates mock tournaments with various edge cases to test the pairing algori
 import json
 import random
 import copy
-from collections import defaultdict
+import itertools
+from collections import Counter, defaultdict
 import sys
 import os
 
@@ -18,6 +19,7 @@ from daness_v2 import (
     calculate_swiss_pairings,
     calculate_final_standings_points_based,
     generate_bracket_seeding,
+    find_best_bracket_arrangement,
 )
 
 
@@ -25,8 +27,8 @@ class MockTournament:
     """Creates mock tournament data for testing"""
     
     def __init__(self, num_players=32, seed=None):
-        if seed:
-            random.seed(seed)
+        # Own RNG so tournaments don't share (or lock on) the global one
+        self.rng = random.Random(seed)
         
         self.num_players = num_players
         self.players = self._generate_players()
@@ -66,7 +68,7 @@ class MockTournament:
         
         win_prob = max(0.1, min(0.9, win_prob))  # Clamp between 10% and 90%
         
-        return random.random() < win_prob
+        return self.rng.random() < win_prob
     
     def simulate_round(self, round_num, pairings, upset_rate=0.2):
         """Simulate all matches in a round"""
@@ -216,14 +218,13 @@ class TournamentTester:
             # Manipulate standings to force certain records
             if round_num == 4:
                 # Count players by record
-                record_counts = defaultdict(list)
-                for name, info in standings.items():
-                    record = (info["wins"], info["losses"])
-                    record_counts[record].append(name)
+                record_counts = Counter(
+                    (info["wins"], info["losses"]) for info in standings.values()
+                )
                 
                 print(f"\nRound {round_num} record distribution:")
-                for record, players in sorted(record_counts.items()):
-                    print(f"  {record[0]}-{record[1]}: {len(players)} players")
+                for record, count in sorted(record_counts.items()):
+                    print(f"  {record[0]}-{record[1]}: {count} players")
             
             pairings = calculate_swiss_pairings(standings, round_number=round_num)
             tournament.simulate_round(round_num, pairings)
@@ -241,6 +242,34 @@ class TournamentTester:
         print(f"✓ Round 5 completed with {rematch_count} rematches")
         return rematch_count <= 1  # Allow at most 1 forced rematch
     
+    def test_exact_group_matching(self):
+        """Test that the exact group search only ever removes round 5 rematches"""
+        # (players, seed): 40/32 is rematch-free without the exact search and
+        # must stay that way; 32/90 needs it to avoid a forced rematch
+        for num_players, seed in [(40, 32), (32, 90)]:
+            tournament = MockTournament(num_players, seed=seed)
+            
+            for round_num in range(1, 5):
+                standings = calculate_standings(tournament.initial_seeding, tournament.match_results)
+                pairings = calculate_swiss_pairings(standings, round_number=round_num)
+                tournament.simulate_round(round_num, pairings)
+            
+            standings = calculate_standings(tournament.initial_seeding, tournament.match_results)
+            pairings = calculate_swiss_pairings(standings, round_number=5)
+            
+            rematches = [
+                (p1_name, p2_name)
+                for (p1_name, p1_info), (p2_name, p2_info) in pairings
+                if p2_name in p1_info["opponents"]
+            ]
+            if rematches or len(pairings) != num_players // 2:
+                print(f"❌ {num_players} players (seed {seed}): rematches {rematches}")
+                return False
+            
+            print(f"✓ {num_players} players (seed {seed}): round 5 has no rematches")
+        
+        return True
+    
     def test_bracket_seeding_fairness(self):
         """Test that bracket seeding properly rewards performance"""
         tournament = MockTournament(32, seed=999)
@@ -271,6 +300,61 @@ class TournamentTester:
         print("✓ Bracket seeding appears fair")
         return True
     
+    def test_bracket_rematch_repair(self):
+        """Test the exact first round re-pair when swaps cannot remove rematches"""
+        # Top half is 4-1 with 20-point gaps (no swaps), then 2-3 and 1-4
+        # groups whose members are a few points apart. P12 has played P4-P7,
+        # so within its group it must face P8 - but P9, who faces P8, has
+        # played P5, who P12 faces. No single swap helps; a 3-cycle does
+        records = [(4, 1, 1000 - 20 * i) for i in range(8)]
+        records += [(2, 3, 209 - i) for i in range(4)] + [(1, 4, 108 - i) for i in range(4)]
+        players = [
+            {
+                "name": f"P{i + 1}",
+                "wins": wins,
+                "losses": losses,
+                "total_score": score,
+                "opponents": [],
+            }
+            for i, (wins, losses, score) in enumerate(records)
+        ]
+        for a, b in [(4, 12), (5, 12), (6, 12), (7, 12), (5, 9)]:
+            players[a - 1]["opponents"].append(f"P{b}")
+            players[b - 1]["opponents"].append(f"P{a}")
+        
+        arranged, rematch_count = find_best_bracket_arrangement(players, "Test")
+        
+        def rematches(bracket):
+            return sum(
+                bracket[15 - i]["name"] in bracket[i]["opponents"] for i in range(8)
+            )
+        
+        def moved(bracket):
+            return sum(abs(players.index(p) - k) for k, p in enumerate(bracket[8:], 8))
+        
+        def cost(bracket):
+            return rematches(bracket), moved(bracket)
+        
+        # Brute force every bottom-half order that keeps the record groups in
+        # place: fewest rematches, then least movement
+        best = min(
+            cost(players[:8] + [players[k] for k in two_three + one_four])
+            for two_three in itertools.permutations(range(8, 12))
+            for one_four in itertools.permutations(range(12, 16))
+        )
+        
+        result = cost(arranged)
+        records_in_order = [(-p["wins"], p["losses"]) for p in arranged]
+        print(f"✓ Re-paired bracket: {result[0]} rematches, moved {result[1]} (best {best})")
+        
+        return (
+            arranged[:8] == players[:8]
+            and records_in_order == sorted(records_in_order)
+            and sorted(p["name"] for p in arranged) == sorted(p["name"] for p in players)
+            and rematch_count == result[0] == 0
+            and result == best
+        )
+    
     def test_edge_cases(self):
         """Test various edge cases"""        
         # Test with extreme upset scenarios
@@ -303,7 +387,9 @@ class TournamentTester:
         self.run_test("High Upset Tournament", self.test_high_upset_tournament)
         self.run_test("Round 5 Critical Matches", self.test_round_5_critical_matches)
         self.run_test("Constraint Satisfaction", self.test_constraint_satisfaction)
+        self.run_test("Exact Group Matching", self.test_exact_group_matching)
         self.run_test("Bracket Seeding Fairness", self.test_bracket_seeding_fairness)
+        self.run_test("Bracket Rematch Repair", self.test_bracket_rematch_repair)
         self.run_test("Edge Cases", self.test_edge_cases)
         
         # Generate report